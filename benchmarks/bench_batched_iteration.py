@@ -0,0 +1,61 @@
+"""
+Benchmark: Batched Jacobi / Gauss-Seidel Throughput
+
+Measures systems/second of `batched_jacobi` and `batched_gauss_seidel` on
+stacks of random diagonally dominant systems (n = 4 ... 64), against a
+Python loop calling the single-system `jacobi` / `gauss_seidel`.
+
+Usage:
+    python benchmarks/bench_batched_iteration.py [--batch 10000] [--sizes 4 16 64]
+
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "iterative_methods"))
+
+from gauss_seidel_iteration import batched_gauss_seidel, gauss_seidel  # noqa: E402
+from jacobi_iteration import batched_jacobi, jacobi  # noqa: E402
+
+def diagonally_dominant_batch(batch, n, rng):
+    """Random (batch, n, n) strictly diagonally dominant matrices and (batch, n) right-hand sides"""
+    A = rng.standard_normal((batch, n, n))
+    row_sums = np.abs(A).sum(axis=2) - np.abs(np.diagonal(A, axis1=1, axis2=2))
+    idx = np.arange(n)
+    A[:, idx, idx] = row_sums * rng.uniform(1.2, 3.0, (batch, n)) + 1.0
+    return A, rng.standard_normal((batch, n))
+
+def throughput(solve, count):
+    """Systems per second of a solve() call that handles `count` systems"""
+    start = time.perf_counter()
+    solve()
+    return count / (time.perf_counter() - start)
+
+def run(batch, sizes, loop_count, tol):
+    rng = np.random.default_rng(0)
+    print(f"{'n':>4} {'method':<13} {'loop (sys/s)':>14} {'batched (sys/s)':>16} {'speedup':>8}")
+
+    for n in sizes:
+        A, b = diagonally_dominant_batch(batch, n, rng)
+        count = min(loop_count, batch)
+        for name, single, batched in [("Jacobi", jacobi, batched_jacobi),
+                                      ("Gauss-Seidel", gauss_seidel, batched_gauss_seidel)]:
+            loop_rate = throughput(lambda: [single(A[i], b[i], tol=tol) for i in range(count)], count)
+            batched_rate = throughput(lambda: batched(A, b, tol=tol), batch)
+            print(f"{n:>4} {name:<13} {loop_rate:>14.0f} {batched_rate:>16.0f} "
+                  f"{batched_rate / loop_rate:>8.1f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--batch", type=int, default=10000)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[4, 8, 16, 32, 64])
+    parser.add_argument("--loop-count", type=int, default=500, help="systems timed in the Python loop")
+    parser.add_argument("--tol", type=float, default=1e-10)
+    args = parser.parse_args()
+
+    run(args.batch, args.sizes, args.loop_count, args.tol)
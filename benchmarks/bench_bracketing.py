@@ -0,0 +1,50 @@
+"""
+Benchmark: Bracketing Root Finders on the Integral Equation
+
+Counts iterations, evaluations of f and wall time of plain regula falsi,
+the Illinois / Pegasus / Anderson-Björck modifications and Brent's method on
+∫₀ˣ e^(-t²) dt = target (the f of regula_falsi_root_finder.py, shifted),
+for several targets and tolerances.
+
+Usage:
+    python benchmarks/bench_bracketing.py [--targets 0.1 0.5 0.8] [--tols 1e-6 1e-10]
+
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "root_finders"))
+
+from regula_falsi_root_finder import f as integral_minus_tenth  # noqa: E402
+from root_solver import solve  # noqa: E402
+
+METHODS = ["regula_falsi", "illinois", "pegasus", "anderson_bjorck", "brent"]
+
+def run(targets, tols, bracket, max_iter):
+    for target in targets:
+        def f(x, target=target):
+            return integral_minus_tenth(x) + 0.1 - target
+
+        for tol in tols:
+            print(f"\n∫₀ˣ e^(-t²) dt = {target:g} on {bracket}, tol = {tol:g}")
+            print(f"{'method':<16} {'root':>14} {'iterations':>10} {'evaluations':>12} {'time (s)':>9}")
+            for method in METHODS:
+                try:
+                    result = solve(method, f, bracket=bracket, tol=tol, max_iter=max_iter)
+                except ValueError as e:
+                    print(f"{method:<16} {'failed: ' + str(e)}")
+                    continue
+                print(f"{method:<16} {result.root:>14.10f} {result.iterations:>10d} "
+                      f"{result.function_evaluations:>12d} {result.elapsed:>9.3f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--targets", type=float, nargs="+", default=[0.1, 0.5, 0.8])
+    parser.add_argument("--tols", type=float, nargs="+", default=[1e-6, 1e-10])
+    parser.add_argument("--bracket", type=float, nargs=2, default=[0.0, 3.0])
+    parser.add_argument("--max-iter", type=int, default=500)
+    args = parser.parse_args()
+
+    run(args.targets, args.tols, tuple(args.bracket), args.max_iter)
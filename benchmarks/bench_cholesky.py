@@ -0,0 +1,69 @@
+"""
+Benchmark: Cholesky Decomposition and Inverse
+
+Times the original `cholesky_decomposition` / `inverse_matrix` against
+`blocked_cholesky`, `cho_solve` and `cho_inverse` on SPD (covariance-like)
+matrices. The original code is only run up to --reference-max-n because its
+inverse costs O(n³) Python-level operations per column.
+
+Usage:
+    python benchmarks/bench_cholesky.py [--sizes 100 500 2000] [--reference-max-n 200]
+
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "linear_system_solvers"))
+
+from cholesky_decomposition import (  # noqa: E402
+    blocked_cholesky,
+    cho_inverse,
+    cho_solve,
+    cholesky_decomposition,
+    inverse_matrix,
+)
+
+def time_call(func, *args):
+    """Returns (result, elapsed seconds) of a single call"""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+def run(sizes, reference_max_n, num_rhs, block_size):
+    rng = np.random.default_rng(0)
+    print(f"{'n':>6} {'orig chol (s)':>14} {'orig inv (s)':>13} {'chol (s)':>9} "
+          f"{f'solve {num_rhs} rhs (s)':>16} {'inverse (s)':>12} {'inv error':>10}")
+
+    for n in sizes:
+        M = rng.standard_normal((n, n))
+        A = M @ M.T / n + np.eye(n)
+        B = rng.standard_normal((n, num_rhs))
+
+        if n <= reference_max_n:
+            _, t_orig_chol = time_call(cholesky_decomposition, A)
+            _, t_orig_inv = time_call(inverse_matrix, A)
+            orig = f"{t_orig_chol:>14.4f} {t_orig_inv:>13.4f}"
+        else:
+            orig = f"{'-':>14} {'-':>13}"
+
+        L, t_chol = time_call(blocked_cholesky, A, block_size)
+        _, t_solve = time_call(cho_solve, L, B, block_size)
+        A_inv, t_inv = time_call(cho_inverse, L, block_size)
+        error = np.max(np.abs(A_inv @ A - np.eye(n)))
+
+        print(f"{n:>6} {orig} {t_chol:>9.4f} {t_solve:>16.4f} {t_inv:>12.4f} {error:>10.1e}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 100, 200, 500, 1000, 2000])
+    parser.add_argument("--reference-max-n", type=int, default=200)
+    parser.add_argument("--rhs", type=int, default=100)
+    parser.add_argument("--block-size", type=int, default=64)
+    args = parser.parse_args()
+
+    run(args.sizes, args.reference_max_n, args.rhs, args.block_size)
@@ -0,0 +1,371 @@
+"""
+Benchmark: Every Solver Across Problem Sizes
+
+Times each solver of the repository on problems whose size spans several
+orders of magnitude, and records per size:
+
+    time          best wall time per call over --repeat runs (seconds)
+    peak_memory   peak traced allocation of one call under tracemalloc (bytes)
+    evaluations   function evaluations (root finders) or sweeps / iterations
+                  (iterative solvers), where the solver has such a count
+
+The size means n for the linear solvers, the number of nodes or query points
+for the interpolators, the batch of independent equations for the scalar root
+finders and the degree for the polynomial solvers. Timing runs are separate
+from the tracemalloc run, so tracing does not slow down the recorded times.
+
+Results can be saved as JSON (--save) and compared against an earlier file
+(--compare): a benchmark whose time or peak memory grew by more than
+--threshold, or whose evaluation count grew at all, is reported as a
+regression and the script exits with status 1.
+
+Usage:
+    python benchmarks/bench_suite.py [--filter cholesky spline] [--max-size 1000]
+                                     [--save results.json] [--compare baseline.json]
+
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+for folder in ("linear_system_solvers", "iterative_methods", "interpolation", "root_finders"):
+    sys.path.insert(0, os.path.join(ROOT, folder))
+
+from LU_decomposition_unit_upper import LU_decomposition  # noqa: E402
+from bracketed_root_finders import brent, modified_regula_falsi  # noqa: E402
+from chebyshev_root_finder import chebyshev_method, halley_method  # noqa: E402
+from cholesky_decomposition import cholesky_decomposition, inverse_matrix  # noqa: E402
+from difference_interpolation import (  # noqa: E402
+    LocalDifferenceInterpolator,
+    NewtonInterpolator,
+    forward_difference_table,
+    forward_interpolation,
+)
+from gauss_elimination_partial_pivoting import gauss_elimination_partial_pivoting  # noqa: E402
+from gauss_seidel_iteration import gauss_seidel  # noqa: E402
+from jacobi_iteration import jacobi  # noqa: E402
+from muller_root_finder import muller_method  # noqa: E402
+from newton_vs_regula_falsi_root_finder import newton_method, regula_falsi_method  # noqa: E402
+from polynomial_roots import aberth_ehrlich, durand_kerner, muller_polynomial_roots  # noqa: E402
+from regula_falsi_root_finder import regula_falsi  # noqa: E402
+from root_solver import CountedFunction  # noqa: E402
+from sparse_matrix import CSRMatrix  # noqa: E402
+from vectorized_root_finders import chebyshev_vectorized, newton_vectorized  # noqa: E402
+
+# --- Problems ---
+
+def dominant_matrix(n, seed=0):
+    """Random diagonally dominant matrix (safe for elimination without growth)"""
+    rng = np.random.default_rng(seed)
+    return rng.standard_normal((n, n)) + n * np.eye(n)
+
+def spd_matrix(n, seed=0):
+    """Random covariance-like SPD matrix"""
+    rng = np.random.default_rng(seed)
+    M = rng.standard_normal((n, n))
+    return M @ M.T / n + np.eye(n)
+
+def tridiagonal_csr(n):
+    """CSRMatrix of tridiag(-1, 4, -1): Jacobi and Gauss-Seidel converge in O(1) sweeps for any n"""
+    rows = np.repeat(np.arange(n), 3)
+    cols = rows + np.tile([-1, 0, 1], n)
+    vals = np.tile([-1.0, 4.0, -1.0], n)
+    keep = (cols >= 0) & (cols < n)
+    indptr = np.concatenate(([0], np.cumsum(np.bincount(rows[keep], minlength=n))))
+    return CSRMatrix(vals[keep], cols[keep], indptr)
+
+def parameters(batch):
+    """a in [0.5, 2]: f(x) = cos(x) - a·x·exp(x) has one root in (0, 1) for each"""
+    return np.linspace(0.5, 2.0, batch).tolist()
+
+def scalar_problem(a):
+    return (lambda x: math.cos(x) - a * x * math.exp(x),
+            lambda x: -math.sin(x) - a * math.exp(x) * (1 + x),
+            lambda x: -math.cos(x) - a * math.exp(x) * (2 + x))
+
+# --- Cases: setup(size) returns a callable whose result is an evaluation count or None ---
+
+def _call(func, *args, **kwargs):
+    """Case running func(*args, **kwargs), for solvers without an evaluation count"""
+    def run():
+        func(*args, **kwargs)
+    return run
+
+def _gauss_elimination(n):
+    A, b = dominant_matrix(n), np.ones(n)
+    return _call(gauss_elimination_partial_pivoting, A, b)
+
+def _lu(n):
+    A = dominant_matrix(n)
+    return _call(LU_decomposition, A)
+
+def _cholesky(n):
+    A = spd_matrix(n)
+    return _call(cholesky_decomposition, A)
+
+def _inverse(n):
+    A = spd_matrix(n)
+    return _call(inverse_matrix, A)
+
+def _jacobi(n):
+    A, b = tridiagonal_csr(n), np.ones(n)
+    return lambda: jacobi(A, b, tol=1e-8)[1].iterations
+
+def _gauss_seidel(n):
+    A, b = tridiagonal_csr(n), np.ones(n)
+    return lambda: gauss_seidel(A, b, tol=1e-8)[1].iterations
+
+def _spline_data(n):
+    x = np.linspace(0.0, 10.0, n)
+    return x, np.sin(x)
+
+def _cubic_spline_coeffs(n):
+    # natural_cubic_spline.py imports matplotlib for its plot, so it is imported
+    # here: without matplotlib only the spline cases are skipped
+    from natural_cubic_spline import cubic_spline_coeffs
+    x, y = _spline_data(n)
+    return _call(cubic_spline_coeffs, x, y)
+
+def _spline_eval(n):
+    from natural_cubic_spline import cubic_spline_coeffs, spline_eval
+    x, y = _spline_data(1000)
+    coeffs = cubic_spline_coeffs(x, y)
+    xq = np.random.default_rng(0).uniform(0.0, 10.0, n)
+    return _call(spline_eval, x, coeffs, xq)
+
+def _difference_data(n):
+    x = np.linspace(0.0, 1.0, n)
+    return x, np.exp(x)
+
+def _difference_table(n):
+    _, y = _difference_data(n)
+    return _call(forward_difference_table, y.tolist())
+
+def _forward_interpolation(n):
+    x, y = _difference_data(n)
+    table = forward_difference_table(y)
+    xq = np.linspace(0.0, 0.5, 20).tolist()
+    h = x[1] - x[0]
+
+    def run():
+        for q in xq:
+            forward_interpolation(q, x[0], h, table)
+    return run
+
+def _newton_interpolator(n):
+    x, y = _difference_data(n)
+    xq = np.linspace(0.0, 1.0, 1000)
+
+    def run():
+        with np.errstate(all="ignore"):
+            NewtonInterpolator(x, y)(xq)
+    return run
+
+def _local_difference_interpolator(n):
+    x, y = _difference_data(n)
+    xq = np.random.default_rng(0).uniform(0.0, 1.0, 10000)
+
+    def run():
+        LocalDifferenceInterpolator(x, y, order=4)(xq)
+    return run
+
+def _scalar_root_finder(solve_one):
+    """Case over a batch of equations; solve_one(f, df, d2f) runs one solver call"""
+    def setup(batch):
+        problems = [scalar_problem(a) for a in parameters(batch)]
+
+        def run():
+            evaluations = 0
+            for f, df, d2f in problems:
+                counted = [CountedFunction(g) for g in (f, df, d2f)]
+                solve_one(*counted)
+                evaluations += sum(g.evaluations for g in counted)
+            return evaluations
+        return run
+    return setup
+
+def _vectorized(solver):
+    def setup(batch):
+        a = np.linspace(0.5, 2.0, batch)
+
+        def f(x, a):
+            return np.cos(x) - a * x * np.exp(x)
+
+        def df(x, a):
+            return -np.sin(x) - a * np.exp(x) * (1 + x)
+
+        def d2f(x, a):
+            return -np.cos(x) - a * np.exp(x) * (2 + x)
+
+        derivatives = (df,) if solver is newton_vectorized else (df, d2f)
+        return lambda: int(solver(f, *derivatives, x0=0.5, args=(a,), tol=1e-12).iterations.sum())
+    return setup
+
+def _polynomial(solver):
+    def setup(degree):
+        coeffs = np.random.default_rng(0).standard_normal(degree + 1)
+        return _call(solver, coeffs)
+    return setup
+
+DECADES = [10, 100, 1000]
+BATCHES = [1, 10, 100, 1000]
+
+# name -> (setup, sizes)
+BENCHMARKS = {
+    "gauss_elimination_partial_pivoting": (_gauss_elimination, DECADES),
+    "LU_decomposition": (_lu, DECADES),
+    "cholesky_decomposition": (_cholesky, [10, 30, 100, 300]),
+    "inverse_matrix": (_inverse, [10, 30, 100]),
+    "jacobi": (_jacobi, [100, 1000, 10000, 100000]),
+    "gauss_seidel": (_gauss_seidel, [100, 1000, 10000, 100000]),
+    "cubic_spline_coeffs": (_cubic_spline_coeffs, [100, 1000, 10000, 100000, 1000000]),
+    "spline_eval": (_spline_eval, [100, 1000, 10000, 100000, 1000000]),
+    "forward_difference_table": (_difference_table, DECADES),
+    "forward_interpolation": (_forward_interpolation, [10, 30, 100]),
+    "NewtonInterpolator": (_newton_interpolator, DECADES),
+    "LocalDifferenceInterpolator": (_local_difference_interpolator, [1000, 10000, 100000, 1000000]),
+    "newton_method": (_scalar_root_finder(
+        lambda f, df, d2f: newton_method(0.5, tol=1e-12, max_iter=50, verbose=False, f=f, f_prime=df)),
+        BATCHES),
+    "chebyshev_method": (_scalar_root_finder(
+        lambda f, df, d2f: chebyshev_method(0.5, tol=1e-12, max_iter=50, verbose=False, f=f, f_prime=df,
+                                            f_double_prime=d2f)), BATCHES),
+    "halley_method": (_scalar_root_finder(
+        lambda f, df, d2f: halley_method(0.5, tol=1e-12, max_iter=50, verbose=False, f=f, f_prime=df,
+                                         f_double_prime=d2f)), BATCHES),
+    "muller_method": (_scalar_root_finder(
+        lambda f, df, d2f: muller_method(0.0, 0.5, 1.0, tol=1e-12, max_iter=50, verbose=False, f=f)),
+        BATCHES),
+    "regula_falsi": (_scalar_root_finder(
+        lambda f, df, d2f: regula_falsi(0.0, 1.0, tol=1e-12, max_iter=500, verbose=False, f=f)),
+        BATCHES),
+    "regula_falsi_method": (_scalar_root_finder(
+        lambda f, df, d2f: regula_falsi_method(0.0, 1.0, tol=1e-12, max_iter=500, verbose=False, f=f)),
+        BATCHES),
+    "modified_regula_falsi": (_scalar_root_finder(
+        lambda f, df, d2f: modified_regula_falsi(f, 0.0, 1.0, tol=1e-12)), BATCHES),
+    "brent": (_scalar_root_finder(lambda f, df, d2f: brent(f, 0.0, 1.0, tol=1e-12)), BATCHES),
+    "newton_vectorized": (_vectorized(newton_vectorized), [100, 10000, 1000000]),
+    "chebyshev_vectorized": (_vectorized(chebyshev_vectorized), [100, 10000, 1000000]),
+    "muller_polynomial_roots": (_polynomial(muller_polynomial_roots), [10, 100, 400, 500]),
+    "aberth_ehrlich": (_polynomial(aberth_ehrlich), [10, 100, 400, 500]),
+    "durand_kerner": (_polynomial(durand_kerner), [10, 30, 100]),
+}
+
+# --- Measurement ---
+
+def measure(run, repeat, min_time):
+    """(best seconds per call, peak traced bytes, evaluation count) of run()"""
+    start = time.perf_counter()
+    evaluations = run()
+    first = time.perf_counter() - start
+
+    # Calls per timing sample, so fast cases are not dominated by timer resolution
+    number = max(1, int(min_time / first)) if first > 0 else 1
+    best = first
+    for _ in range(repeat - 1 if number == 1 else repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        best = min(best, (time.perf_counter() - start) / number)
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak, evaluations
+
+def metadata():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {"commit": commit, "python": platform.python_version(), "numpy": np.__version__,
+            "machine": platform.machine(), "date": time.strftime("%Y-%m-%d %H:%M:%S")}
+
+def run(names, max_size, repeat, min_time):
+    """Runs the selected benchmarks and returns their records"""
+    records = []
+    print(f"{'benchmark':<36} {'size':>8} {'time (s)':>11} {'peak memory':>12} {'evaluations':>12}")
+    for name in names:
+        setup, sizes = BENCHMARKS[name]
+        for size in sizes:
+            if size > max_size:
+                continue
+            try:
+                case = setup(size)
+            except ImportError as e:
+                print(f"{name:<36} {size:>8} skipped: {e}")
+                break
+            seconds, peak, evaluations = measure(case, repeat, min_time)
+            records.append({"name": name, "size": size, "time": seconds, "peak_memory": peak,
+                            "evaluations": evaluations})
+            count = "-" if evaluations is None else evaluations
+            print(f"{name:<36} {size:>8} {seconds:>11.3e} {format_bytes(peak):>12} {count:>12}")
+    return records
+
+def format_bytes(size):
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+def compare(records, baseline, threshold):
+    """Prints each benchmark against the baseline records; returns the number of regressions"""
+    previous = {(record["name"], record["size"]): record for record in baseline}
+    regressions = 0
+    print(f"\n{'benchmark':<36} {'size':>8} {'time ratio':>11} {'memory ratio':>13} {'evaluations':>14}")
+    for record in records:
+        old = previous.get((record["name"], record["size"]))
+        if old is None:
+            continue
+        time_ratio = record["time"] / old["time"] if old["time"] > 0 else math.inf
+        memory_ratio = record["peak_memory"] / old["peak_memory"] if old["peak_memory"] > 0 else 1.0
+        more_evaluations = (record["evaluations"] is not None and old["evaluations"] is not None
+                            and record["evaluations"] > old["evaluations"])
+        regressed = time_ratio > threshold or memory_ratio > threshold or more_evaluations
+        regressions += regressed
+        evaluations = "-" if record["evaluations"] is None else f"{old['evaluations']}->{record['evaluations']}"
+        print(f"{record['name']:<36} {record['size']:>8} {time_ratio:>11.2f} {memory_ratio:>13.2f} "
+              f"{evaluations:>14}{'  REGRESSION' if regressed else ''}")
+    print(f"\n{regressions} regression(s) beyond a factor of {threshold:g}")
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--filter", nargs="+", default=[],
+                        help="Run only benchmarks whose name contains one of these strings")
+    parser.add_argument("--max-size", type=int, default=10 ** 6)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--min-time", type=float, default=0.05,
+                        help="Minimum seconds per timing sample (fast calls are looped)")
+    parser.add_argument("--save", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON file of an earlier run to check for regressions")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args()
+
+    names = [name for name in BENCHMARKS
+             if not args.filter or any(part.lower() in name.lower() for part in args.filter)]
+    records = run(names, args.max_size, args.repeat, args.min_time)
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump({"metadata": metadata(), "results": records}, file, indent=1)
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+        sys.exit(1 if compare(records, baseline, args.threshold) else 0)
@@ -9,28 +9,27 @@ Goal:
     - Construct forward and backward difference tables
     - Interpolate f(0.25) and f(0.35) using both methods
 
+`NewtonInterpolator` precomputes the table once and evaluates both formulas
+over arrays of query points. `LocalDifferenceInterpolator` keeps differences
+only up to a fixed order p and interpolates each query on its nearest p + 1
+nodes, for tables far too large for a single global polynomial.
+
 """
 
 import numpy as np
 from math import factorial
 
-# Given data
-x_vals = [0.1, 0.2, 0.3, 0.4, 0.5]
-y_vals = [1.40, 1.56, 1.76, 2.00, 2.28]
-
-n = len(x_vals)
-h = x_vals[1] - x_vals[0]  # Assumes equal spacing
-
 # Create forward difference table
 def forward_difference_table(y):
-    diff_table = [y.copy()]
+    n = len(y)
+    diff_table = [list(y)]
     for level in range(1, n):
         next_diff = [diff_table[-1][i+1] - diff_table[-1][i] for i in range(n - level)]
         diff_table.append(next_diff)
     return diff_table
 
 # Forward interpolation using Newton’s method
-def forward_interpolation(x, x0, diff_table):
+def forward_interpolation(x, x0, h, diff_table):
     u = (x - x0) / h
     result = diff_table[0][0]
     for i in range(1, len(diff_table)):
@@ -41,7 +40,7 @@ def forward_interpolation(x, x0, diff_table):
     return result
 
 # Backward interpolation using Newton’s method
-def backward_interpolation(x, xn, diff_table):
+def backward_interpolation(x, xn, h, diff_table):
     u = (x - xn) / h
     result = diff_table[0][-1]
     for i in range(1, len(diff_table)):
@@ -51,20 +50,209 @@ def backward_interpolation(x, xn, diff_table):
         result += term / factorial(i)
     return result
 
-# Generate tables and interpolate
-fwd_table = forward_difference_table(y_vals)
+class NewtonInterpolator:
+    """
+    Newton forward/backward difference interpolator on equally spaced data.
+
+    The difference table is built once and stored packed in one NumPy array
+    (level i holds n - i differences). The leading and trailing differences
+    are pre-divided by i!, so evaluating at an array of points is a nested
+    (Horner-like) loop of `degree` vectorized steps.
+    """
+
+    def __init__(self, x, y):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        n = len(x)
+        if n < 2 or len(y) != n:
+            raise ValueError("x and y must have the same length (at least 2).")
+        self.h = x[1] - x[0]
+        if not np.allclose(np.diff(x), self.h):
+            raise ValueError("Newton difference interpolation needs equally spaced x.")
+        self.x0, self.xn = x[0], x[-1]
+
+        # Packed triangular table: level i occupies table[offsets[i]:offsets[i] + n - i]
+        self.offsets = np.concatenate(([0], np.cumsum(np.arange(n, 0, -1))))
+        self.table = np.empty(self.offsets[-1])
+        level = y
+        for i in range(n):
+            self.table[self.offsets[i]:self.offsets[i + 1]] = level
+            level = np.diff(level)
+
+        inv_factorial = 1.0 / np.cumprod(np.concatenate(([1.0], np.arange(1.0, n))))
+        self.forward_coeffs = self.table[self.offsets[:-1]] * inv_factorial
+        self.backward_coeffs = self.table[self.offsets[1:] - 1] * inv_factorial
+
+    @property
+    def degree(self):
+        return len(self.forward_coeffs) - 1
+
+    def level(self, i):
+        """The i-th order differences Δⁱy"""
+        return self.table[self.offsets[i]:self.offsets[i + 1]]
+
+    def forward(self, xq):
+        """Newton forward interpolation at scalar or array xq"""
+        u = (np.asarray(xq, dtype=float) - self.x0) / self.h
+        result = np.full_like(u, self.forward_coeffs[-1])
+        for i in range(self.degree - 1, -1, -1):
+            result = self.forward_coeffs[i] + (u - i) * result
+        return result
+
+    def backward(self, xq):
+        """Newton backward interpolation at scalar or array xq"""
+        u = (np.asarray(xq, dtype=float) - self.xn) / self.h
+        result = np.full_like(u, self.backward_coeffs[-1])
+        for i in range(self.degree - 1, -1, -1):
+            result = self.backward_coeffs[i] + (u + i) * result
+        return result
+
+    def __call__(self, xq):
+        """Forward formula in the first half of the table, backward formula in the second"""
+        xq = np.asarray(xq, dtype=float)
+        midpoint = 0.5 * (self.x0 + self.xn)
+        return np.where(xq <= midpoint, self.forward(xq), self.backward(xq))
+
+class LocalDifferenceInterpolator:
+    """
+    Sliding-stencil difference interpolation of fixed order p on a uniform grid.
+
+    Only differences up to order p are kept, as a (p + 1, n) array with
+    Δᵏy[i] in row k, so building costs O(n·p). Each query uses the p + 1
+    nodes nearest to it, found by index arithmetic: the central formula
+    (Stirling for even p, Bessel for odd p) in the interior, and Newton's
+    forward / backward formula where the stencil meets the start / end of
+    the table. Every query costs O(p), vectorized over the batch.
+    """
+
+    def __init__(self, x, y, order=4):
+        x = np.asarray(x, dtype=float)
+        h = x[1] - x[0]
+        if not np.allclose(np.diff(x), h):
+            raise ValueError("Difference interpolation needs equally spaced x.")
+        self._build(x[0], h, y, order)
+
+    @classmethod
+    def from_grid(cls, x0, h, y, order=4):
+        """Builds the interpolator from a uniform-grid description (x_i = x0 + i·h)"""
+        self = cls.__new__(cls)
+        self._build(float(x0), float(h), y, order)
+        return self
+
+    @classmethod
+    def from_differences(cls, x0, h, diffs):
+        """Wraps a precomputed (p + 1, n) difference array, e.g. a memory-mapped one"""
+        self = cls.__new__(cls)
+        self._set_differences(float(x0), float(h), diffs)
+        return self
+
+    def _build(self, x0, h, y, order):
+        y = np.asarray(y, dtype=float)
+        n = len(y)
+        if order < 1 or n < order + 1:
+            raise ValueError("Need 1 <= order and at least order + 1 points.")
+        diffs = np.zeros((order + 1, n))
+        diffs[0] = y
+        for k in range(1, order + 1):
+            diffs[k, :n - k] = diffs[k - 1, 1:n - k + 1] - diffs[k - 1, :n - k]
+        self._set_differences(x0, h, diffs)
+
+    def _set_differences(self, x0, h, diffs):
+        self.x0, self.h = x0, h
+        self.order, self.n = diffs.shape[0] - 1, diffs.shape[1]
+        self.diffs = diffs
+        self.inv_factorial = 1.0 / np.cumprod(np.concatenate(([1.0], np.arange(1.0, self.order + 1))))
+
+    def __call__(self, xq):
+        xq = np.asarray(xq, dtype=float)
+        s = ((xq - self.x0) / self.h).ravel()
+        p, n = self.order, self.n
+        M = p // 2
+
+        # Anchor node of the central stencil, and the range where it fits in the table
+        if p % 2 == 0:
+            i0 = np.rint(s).astype(np.intp)
+            hi = n - 1 - M
+        else:
+            i0 = np.floor(s).astype(np.intp)
+            hi = n - 2 - M
+        result = np.empty_like(s)
+
+        near_start, near_end = i0 < M, i0 > hi
+        central = ~(near_start | near_end)
+        if near_start.any():
+            result[near_start] = self._forward(s[near_start])
+        if near_end.any():
+            result[near_end] = self._backward(s[near_end] - (n - 1))
+        if central.any():
+            evaluate = self._stirling if p % 2 == 0 else self._bessel
+            result[central] = evaluate(i0[central], s[central] - i0[central])
+        return result.reshape(xq.shape)
+
+    def _forward(self, u):
+        """Newton forward formula from node 0"""
+        c = self.diffs[:, 0] * self.inv_factorial
+        result = np.full_like(u, c[-1])
+        for k in range(self.order - 1, -1, -1):
+            result = c[k] + (u - k) * result
+        return result
+
+    def _backward(self, u):
+        """Newton backward formula from node n - 1 (∇ᵏy[n-1] = Δᵏy[n-1-k])"""
+        k = np.arange(self.order + 1)
+        c = self.diffs[k, self.n - 1 - k] * self.inv_factorial
+        result = np.full_like(u, c[-1])
+        for k in range(self.order - 1, -1, -1):
+            result = c[k] + (u + k) * result
+        return result
+
+    def _stirling(self, i0, u):
+        """Stirling's central formula on nodes i0 - p/2 .. i0 + p/2"""
+        D, inv_fact = self.diffs, self.inv_factorial
+        result = D[0, i0].copy()
+        P = np.ones_like(u)                      # ∏_{l<m} (u² - l²)
+        u_sq = u * u
+        for m in range(1, self.order // 2 + 1):
+            odd_mean = 0.5 * (D[2*m - 1, i0 - m] + D[2*m - 1, i0 - m + 1])
+            result += u * P * inv_fact[2*m - 1] * odd_mean
+            result += u_sq * P * inv_fact[2*m] * D[2*m, i0 - m]
+            P *= u_sq - m * m
+        return result
+
+    def _bessel(self, i0, u):
+        """Bessel's central formula on nodes i0 - (p-1)/2 .. i0 + (p+1)/2"""
+        D, inv_fact = self.diffs, self.inv_factorial
+        v = u - 0.5
+        result = 0.5 * (D[0, i0] + D[0, i0 + 1]) + v * D[1, i0]
+        Q = u * (u - 1)                          # ∏_{l=-(m-1)}^{m} (u - l)
+        for m in range(1, self.order // 2 + 1):
+            even_mean = 0.5 * (D[2*m, i0 - m] + D[2*m, i0 - m + 1])
+            result += Q * inv_fact[2*m] * even_mean
+            result += v * Q * inv_fact[2*m + 1] * D[2*m + 1, i0 - m]
+            Q *= (u + m) * (u - m - 1)
+        return result
+
+if __name__ == "__main__":
+    # Given data
+    x_vals = [0.1, 0.2, 0.3, 0.4, 0.5]
+    y_vals = [1.40, 1.56, 1.76, 2.00, 2.28]
+
+    h = x_vals[1] - x_vals[0]  # Assumes equal spacing
+
+    # Generate tables and interpolate
+    fwd_table = forward_difference_table(y_vals)
 
-# Interpolation points
-points = [0.25, 0.35]
+    # Interpolation points
+    points = [0.25, 0.35]
 
-# Forward Interpolation (near beginning)
-print("Using Forward Difference Interpolation:")
-for pt in points:
-    value = forward_interpolation(pt, x_vals[0], fwd_table)
-    print(f"f({pt}) ≈ {value:.5f}")
+    # Forward Interpolation (near beginning)
+    print("Using Forward Difference Interpolation:")
+    for pt in points:
+        value = forward_interpolation(pt, x_vals[0], h, fwd_table)
+        print(f"f({pt}) ≈ {value:.5f}")
 
-# Backward Interpolation (near end)
-print("\nUsing Backward Difference Interpolation:")
-for pt in points:
-    value = backward_interpolation(pt, x_vals[-1], fwd_table)
-    print(f"f({pt}) ≈ {value:.5f}")
+    # Backward Interpolation (near end)
+    print("\nUsing Backward Difference Interpolation:")
+    for pt in points:
+        value = backward_interpolation(pt, x_vals[-1], h, fwd_table)
+        print(f"f({pt}) ≈ {value:.5f}")
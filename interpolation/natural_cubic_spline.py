@@ -18,46 +18,193 @@ Goal:
 
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.linalg import solve
+
+# Tridiagonal solver (Thomas algorithm), O(n)
+def thomas_solve(sub, diag, sup, rhs):
+    """Solves a tridiagonal system; row i reads sub[i]*z[i-1] + diag[i]*z[i] + sup[i]*z[i+1] = rhs[i]"""
+    sub, diag, sup, rhs = (np.asarray(v, dtype=float).tolist() for v in (sub, diag, sup, rhs))
+    n = len(diag)
+    # Forward elimination
+    for i in range(1, n):
+        w = sub[i] / diag[i-1]
+        diag[i] -= w * sup[i-1]
+        rhs[i] -= w * rhs[i-1]
+    # Back substitution
+    z = [0.0] * n
+    z[n-1] = rhs[n-1] / diag[n-1]
+    for i in range(n - 2, -1, -1):
+        z[i] = (rhs[i] - sup[i] * z[i+1]) / diag[i]
+    return np.array(z)
 
 # Step 1: Spline coefficients
 def cubic_spline_coeffs(x, y):
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
     n = len(x) - 1
-    h = [x[i+1] - x[i] for i in range(n)]
-
-    # Construct system for internal second derivatives
-    A = [[0] * (n-1) for _ in range(n-1)]
-    r = [0] * (n-1)
-
-    for i in range(n-1):
-        A[i][i] = 2 * (h[i] + h[i+1])
-        if i > 0:
-            A[i][i-1] = h[i]
-        if i < n-2:
-            A[i][i+1] = h[i+1]
-        r[i] = 3 * ((y[i+2] - y[i+1]) / h[i+1] - (y[i+1] - y[i]) / h[i])
-
-    # Solve Ac = r for internal c (second derivatives)
-    c = [0] * (n + 1)
+    h = np.diff(x)
+    slope = np.diff(y) / h
+
+    # Tridiagonal system for internal c (natural spline: c[0] = c[n] = 0)
+    c = np.zeros(n + 1)
     if n - 1 > 0:
-        c[1:n] = solve(A, r).tolist()  # natural spline: c[0] = c[n] = 0
+        diag = 2 * (h[:-1] + h[1:])
+        sub = np.concatenate(([0.0], h[1:-1]))
+        sup = np.concatenate((h[1:-1], [0.0]))
+        r = 3 * (slope[1:] - slope[:-1])
+        c[1:n] = thomas_solve(sub, diag, sup, r)
 
     # Compute b and d
-    b = [0] * n
-    d = [0] * n
-    for i in range(n):
-        b[i] = (y[i+1] - y[i]) / h[i] - h[i] * (2*c[i] + c[i+1]) / 3
-        d[i] = (c[i+1] - c[i]) / (3*h[i])
+    b = slope - h * (2*c[:-1] + c[1:]) / 3
+    d = (c[1:] - c[:-1]) / (3*h)
 
     a = y[:-1]
     return a, b, c[:-1], d  # return up to index n-1 (each segment)
 
-# Step 2: Evaluate spline at any xp
+# Step 2: Evaluate spline at any xp (scalar or array)
 def spline_eval(x, coeffs, xp):
     a, b, c, d = coeffs
-    i = next((j for j in range(len(x)-1) if x[j] <= xp < x[j+1]), len(x)-2)
+    x = np.asarray(x, dtype=float)
+    # Segment lookup by binary search; points outside [x0, xn] extrapolate the end segments
+    i = np.clip(np.searchsorted(x, xp, side='right') - 1, 0, len(x) - 2)
     t = xp - x[i]
-    return a[i] + b[i]*t + c[i]*t**2 + d[i]*t**3
+    # Horner's rule: a + t(b + t(c + t d))
+    return a[i] + t * (b[i] + t * (c[i] + t * d[i]))
+
+class CubicSpline:
+    """
+    Natural cubic spline through (x, y), built in O(n) and evaluated vectorized.
+
+    Calling the spline with an array of points does one np.searchsorted over
+    the knots and one Horner pass, so large query batches cost O(m log n).
+    """
+
+    def __init__(self, x, y):
+        self.x = np.asarray(x, dtype=float)
+        if len(self.x) < 2 or np.any(np.diff(self.x) <= 0):
+            raise ValueError("Knots x must be strictly increasing with at least two points.")
+        self.coeffs = cubic_spline_coeffs(self.x, y)
+
+    def __call__(self, xp):
+        return spline_eval(self.x, self.coeffs, np.asarray(xp, dtype=float))
+
+class StreamingCubicSpline:
+    """
+    Natural cubic spline that grows at the right end without a full refit.
+
+    The Thomas forward-elimination state (modified diagonal and right-hand
+    side) of existing rows does not depend on later knots, so it is kept.
+    Appending k knots eliminates k new rows, then back-substitutes from the
+    new end only until the corrections to c fall below `tol` (they decay
+    geometrically, by about 0.27 per segment on a uniform grid). This costs
+    amortized O(k) per append.
+
+    With `window` set, only the latest `window` knots are kept and storage is
+    compacted in place, so memory stays constant on unbounded streams.
+    """
+
+    def __init__(self, x, y, window=None, tol=1e-14):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if len(x) < 2:
+            raise ValueError("At least two knots are needed.")
+        if window is not None and window < 3:
+            raise ValueError("window must keep at least 3 knots.")
+        self.window = window
+        self.tol = tol
+
+        capacity = max(16, 2 * len(x), 2 * window if window else 0)
+        # Per-knot arrays: knots, values, c, and forward-elimination state (dp, rp);
+        # b and d are stored per segment at the index of its left knot
+        self._x, self._y, self._c, self._dp, self._rp, self._b, self._d = (
+            np.zeros(capacity) for _ in range(7))
+        self._offset = 0                  # global index of slot 0
+        self._start = 0                   # slot of the first live knot
+        self._end = 1                     # slot one past the last knot
+        self._x[0], self._y[0] = x[0], y[0]
+        self.extend(x[1:], y[1:])
+
+    def _reserve(self, k):
+        """Makes room for k more knots, compacting (window) or doubling the storage"""
+        if self._end + k <= len(self._x):
+            return
+        live = self._end - self._start
+        capacity = max(len(self._x), 2 * (live + k))
+        for name in ("_x", "_y", "_c", "_dp", "_rp", "_b", "_d"):
+            old = getattr(self, name)
+            new = np.zeros(capacity) if capacity > len(old) else old
+            new[:live] = old[self._start:self._end]
+            setattr(self, name, new)
+        self._offset += self._start
+        self._start, self._end = 0, live
+
+    def append(self, x_new, y_new):
+        """Appends one knot to the right end"""
+        self.extend([x_new], [y_new])
+
+    def extend(self, xs, ys):
+        """Appends knots xs (strictly increasing, beyond the last knot) with values ys"""
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        k = len(xs)
+        if k == 0:
+            return
+        if np.any(np.diff(np.concatenate(([self._x[self._end - 1]], xs))) <= 0):
+            raise ValueError("Appended knots must be strictly increasing and beyond the last knot.")
+
+        self._reserve(k)
+        x, y, c, dp, rp = self._x, self._y, self._c, self._dp, self._rp
+        old_last = self._end - 1
+        x[self._end:self._end + k] = xs
+        y[self._end:self._end + k] = ys
+        c[self._end:self._end + k] = 0.0
+        self._end += k
+        first_interior = 1 - self._offset  # slot of global knot 1
+
+        # Forward elimination of the rows that just became interior
+        for i in range(max(old_last, first_interior), self._end - 1):
+            h0, h1 = x[i] - x[i-1], x[i+1] - x[i]
+            r = 3 * ((y[i+1] - y[i]) / h1 - (y[i] - y[i-1]) / h0)
+            if i == first_interior:
+                dp[i], rp[i] = 2 * (h0 + h1), r
+            else:
+                w = h0 / dp[i-1]
+                dp[i] = 2 * (h0 + h1) - w * h0
+                rp[i] = r - w * rp[i-1]
+
+        # Back substitution from the new end, stopping once corrections are negligible
+        c[self._end - 1] = 0.0  # natural boundary at the new right end
+        i = self._end - 2
+        while i >= max(first_interior, self._start):
+            c_new = (rp[i] - (x[i+1] - x[i]) * c[i+1]) / dp[i]
+            if i < old_last and abs(c_new - c[i]) <= self.tol * max(1.0, abs(c_new)):
+                break
+            c[i] = c_new
+            i -= 1
+
+        # Refresh b and d of the segments whose end c values changed
+        j = max(i, self._start)
+        h = np.diff(x[j:self._end])
+        slope = np.diff(y[j:self._end]) / h
+        self._b[j:self._end - 1] = slope - h * (2 * c[j:self._end - 1] + c[j+1:self._end]) / 3
+        self._d[j:self._end - 1] = (c[j+1:self._end] - c[j:self._end - 1]) / (3 * h)
+
+        # Evict the oldest segments beyond the window
+        if self.window is not None and self._end - self._start > self.window:
+            self._start = self._end - self.window
+
+    @property
+    def x(self):
+        """Live knots"""
+        return self._x[self._start:self._end]
+
+    @property
+    def coeffs(self):
+        """(a, b, c, d) of the live segments, as returned by cubic_spline_coeffs"""
+        s, e = self._start, self._end - 1
+        return self._y[s:e], self._b[s:e], self._c[s:e], self._d[s:e]
+
+    def __call__(self, xp):
+        return spline_eval(self.x, self.coeffs, np.asarray(xp, dtype=float))
 
 # Step 3: Print each segment equation
 def print_spline_equations(x, coeffs):
@@ -68,7 +215,7 @@ def print_spline_equations(x, coeffs):
 # Step 4: Plot the spline
 def plot_spline(x, y, coeffs):
     x_vals = np.linspace(min(x), max(x), 200)
-    y_vals = [spline_eval(x, coeffs, xi) for xi in x_vals]
+    y_vals = spline_eval(x, coeffs, x_vals)
     plt.plot(x, y, 'o', label='Data Points')
     plt.plot(x_vals, y_vals, label='Cubic Spline')
     plt.axvline(1.5, color='gray', linestyle='--', label='x = 1.5')
@@ -79,15 +226,16 @@ def plot_spline(x, y, coeffs):
     plt.grid(True)
     plt.show()
 
-# Step 5: Run program
-x = [0, 1, 2, 3]
-y = [1, 4, 10, 8]
+if __name__ == "__main__":
+    # Step 5: Run program
+    x = [0, 1, 2, 3]
+    y = [1, 4, 10, 8]
 
-coeffs = cubic_spline_coeffs(x, y)
-estimate = spline_eval(x, coeffs, 1.5)
+    coeffs = cubic_spline_coeffs(x, y)
+    estimate = spline_eval(x, coeffs, 1.5)
 
-print(f"\nEstimated f(1.5) ≈ {estimate:.5f}\n")
-print("Cubic spline equations:")
-print_spline_equations(x, coeffs)
-print()
-plot_spline(x, y, coeffs)
+    print(f"\nEstimated f(1.5) ≈ {estimate:.5f}\n")
+    print("Cubic spline equations:")
+    print_spline_equations(x, coeffs)
+    print()
+    plot_spline(x, y, coeffs)
@@ -0,0 +1,228 @@
+"""
+Memory-Mapped Tabulated Data
+
+Opens large lookup tables as read-only np.memmap views instead of parsing
+them into Python lists. Supported layouts:
+
+    .npy of shape (n, 2)   x and y columns
+    .npy of shape (n,)     y on a uniform grid (x0 and h given by the caller)
+    raw float64 "xy"       interleaved x, y pairs
+    raw float64 "grid"     header [x0, h] followed by the n values of y
+
+Natural cubic spline coefficients and fixed-order difference tables are
+built chunk by chunk (O(chunk_size) working memory) and written to .npy
+files that are memory-mapped in turn, so a service can reopen a prepared
+table in milliseconds.
+
+Goal:
+    - Write a 10⁶-row uniform-grid table of sin(x)
+    - Build its spline and difference-table files chunk by chunk
+    - Reopen everything and interpolate
+
+"""
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from difference_interpolation import LocalDifferenceInterpolator
+
+class Table:
+    """Tabulated y(x): either explicit x values or a uniform grid x_i = x0 + i·h"""
+
+    def __init__(self, y, x=None, x0=None, h=None):
+        if x is None and (x0 is None or h is None):
+            raise ValueError("Give either x values or a uniform grid (x0, h).")
+        self.y = y
+        self.x = x
+        self.x0, self.h = (None, None) if x is not None else (float(x0), float(h))
+
+    @property
+    def n(self):
+        return len(self.y)
+
+    @property
+    def is_uniform(self):
+        return self.x is None
+
+    def x_chunk(self, start, stop):
+        """x values of rows start..stop-1 (a view, or computed for a uniform grid)"""
+        if self.x is not None:
+            return np.asarray(self.x[start:stop], dtype=float)
+        return self.x0 + self.h * np.arange(start, stop)
+
+def open_table(path, layout=None, x0=None, h=None):
+    """
+    Memory-maps a tabulated-data file.
+
+    Parameters:
+        path (str): .npy file or raw little-endian float64 file
+        layout (str): "xy" or "grid" for raw files (ignored for .npy)
+        x0, h (float): Grid origin and spacing for a 1-D .npy of y values
+
+    Returns:
+        Table: Zero-copy views of the data
+    """
+    if str(path).endswith(".npy"):
+        data = np.load(path, mmap_mode="r")
+        if data.ndim == 2 and data.shape[1] == 2:
+            return Table(data[:, 1], x=data[:, 0])
+        if data.ndim == 1:
+            return Table(data, x0=x0, h=h)
+        raise ValueError(f"Unsupported .npy shape {data.shape}; expected (n, 2) or (n,).")
+
+    raw = np.memmap(path, dtype="<f8", mode="r")
+    if layout == "xy":
+        pairs = raw.reshape(-1, 2)
+        return Table(pairs[:, 1], x=pairs[:, 0])
+    if layout == "grid":
+        return Table(raw[2:], x0=raw[0], h=raw[1])
+    raise ValueError("Raw files need layout='xy' or layout='grid'.")
+
+def save_grid_table(path, x0, h, y):
+    """Writes y on the grid x0 + i·h in the raw "grid" layout"""
+    np.concatenate(([x0, h], np.asarray(y, dtype="<f8"))).astype("<f8").tofile(path)
+
+class MappedSpline:
+    """Natural cubic spline over a Table with an (n - 1, 4) coefficient array [a, b, c, d]"""
+
+    def __init__(self, table, coeffs):
+        self.table = table
+        self.coeffs = coeffs
+
+    def __call__(self, xp):
+        xp = np.asarray(xp, dtype=float)
+        n = self.table.n
+        if self.table.is_uniform:
+            i = np.clip(np.floor((xp - self.table.x0) / self.table.h).astype(np.intp), 0, n - 2)
+            t = xp - (self.table.x0 + i * self.table.h)
+        else:
+            i = np.clip(np.searchsorted(self.table.x, xp, side="right") - 1, 0, n - 2)
+            t = xp - self.table.x[i]
+        a, b, c, d = np.asarray(self.coeffs[i]).T
+        return a + t * (b + t * (c + t * d))
+
+def build_spline_coefficients(table, path, chunk_size=1 << 20):
+    """
+    Builds natural cubic spline coefficients chunk by chunk into an .npy file.
+
+    The Thomas forward sweep stores its modified diagonal and right-hand side
+    in the b and d columns of the output, the backward sweep fills c, and a
+    last pass overwrites b and d with their final values.
+
+    Returns:
+        MappedSpline: Spline backed by the memory-mapped coefficient file
+    """
+    n = table.n
+    if n < 2:
+        raise ValueError("At least two points are needed.")
+    y = table.y
+    coeffs = open_memmap(path, mode="w+", dtype=np.float64, shape=(n - 1, 4))
+
+    # Pass 1: forward elimination over the interior rows 1..n-2
+    dp_prev = rp_prev = 0.0
+    for s in range(1, n - 1, chunk_size):
+        e = min(s + chunk_size, n - 1)
+        h = np.diff(table.x_chunk(s - 1, e + 1))
+        slope = np.diff(np.asarray(y[s - 1:e + 1], dtype=float)) / h
+        diag = (2 * (h[:-1] + h[1:])).tolist()
+        r = (3 * (slope[1:] - slope[:-1])).tolist()
+        h_left = h[:-1].tolist()
+        dp, rp = [0.0] * (e - s), [0.0] * (e - s)
+        for j in range(e - s):
+            if s + j == 1:
+                dp_prev, rp_prev = diag[j], r[j]
+            else:
+                w = h_left[j] / dp_prev
+                dp_prev = diag[j] - w * h_left[j]
+                rp_prev = r[j] - w * rp_prev
+            dp[j], rp[j] = dp_prev, rp_prev
+        coeffs[s:e, 1] = dp
+        coeffs[s:e, 3] = rp
+
+    # Pass 2: back substitution for c (natural ends: c[0] = c[n-1] = 0)
+    coeffs[0, 2] = 0.0
+    c_next = 0.0
+    for e in range(n - 1, 1, -chunk_size):
+        s = max(1, e - chunk_size)
+        h = np.diff(table.x_chunk(s, e + 1)).tolist()
+        dp, rp = coeffs[s:e, 1].tolist(), coeffs[s:e, 3].tolist()
+        c = [0.0] * (e - s)
+        for j in range(e - s - 1, -1, -1):
+            c_next = (rp[j] - h[j] * c_next) / dp[j]
+            c[j] = c_next
+        coeffs[s:e, 2] = c
+
+    # Pass 3: a, b and d of every segment
+    for s in range(0, n - 1, chunk_size):
+        e = min(s + chunk_size, n - 1)
+        h = np.diff(table.x_chunk(s, e + 1))
+        ys = np.asarray(y[s:e + 1], dtype=float)
+        c = np.array(coeffs[s:e, 2])
+        c_next = np.append(coeffs[s + 1:e, 2], coeffs[e, 2] if e < n - 1 else 0.0)
+        coeffs[s:e, 0] = ys[:-1]
+        coeffs[s:e, 1] = np.diff(ys) / h - h * (2 * c + c_next) / 3
+        coeffs[s:e, 3] = (c_next - c) / (3 * h)
+
+    coeffs.flush()
+    return MappedSpline(table, coeffs)
+
+def open_spline(table, path):
+    """Reopens a coefficient file written by build_spline_coefficients"""
+    return MappedSpline(table, np.load(path, mmap_mode="r"))
+
+def build_difference_table(table, path, order=4, chunk_size=1 << 20):
+    """
+    Builds differences up to `order` of a uniform-grid table chunk by chunk into an .npy file.
+
+    Returns:
+        LocalDifferenceInterpolator: Interpolator backed by the memory-mapped differences
+    """
+    if not table.is_uniform:
+        raise ValueError("Difference tables need a uniform-grid table.")
+    n = table.n
+    if n < order + 1:
+        raise ValueError("Need at least order + 1 points.")
+    diffs = open_memmap(path, mode="w+", dtype=np.float64, shape=(order + 1, n))
+
+    for s in range(0, n, chunk_size):
+        e = min(s + chunk_size, n)
+        level = np.asarray(table.y[s:min(e + order, n)], dtype=float)
+        for k in range(order + 1):
+            count = min(e - s, len(level))
+            diffs[k, s:s + count] = level[:count]
+            level = np.diff(level)
+
+    diffs.flush()
+    return LocalDifferenceInterpolator.from_differences(table.x0, table.h, diffs)
+
+def open_difference_table(table, path):
+    """Reopens a difference file written by build_difference_table"""
+    return LocalDifferenceInterpolator.from_differences(table.x0, table.h, np.load(path, mmap_mode="r"))
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+
+    n = 1_000_000
+    x0, h = 0.0, 1e-4
+    with tempfile.TemporaryDirectory() as folder:
+        table_path = os.path.join(folder, "sin_table.bin")
+        save_grid_table(table_path, x0, h, np.sin(x0 + h * np.arange(n)))
+
+        start = time.perf_counter()
+        table = open_table(table_path, layout="grid")
+        build_spline_coefficients(table, os.path.join(folder, "sin_spline.npy"))
+        build_difference_table(table, os.path.join(folder, "sin_diffs.npy"), order=4)
+        print(f"Built spline and difference files for {n} rows in {time.perf_counter() - start:.2f} s")
+
+        start = time.perf_counter()
+        table = open_table(table_path, layout="grid")
+        spline = open_spline(table, os.path.join(folder, "sin_spline.npy"))
+        local = open_difference_table(table, os.path.join(folder, "sin_diffs.npy"))
+        print(f"Reopened table and coefficient files in {1e3 * (time.perf_counter() - start):.2f} ms")
+
+        points = np.array([0.12345, 12.3456, 98.7654])
+        print("\nx        spline          local (p = 4)   exact")
+        for xp, s_val, l_val in zip(points, spline(points), local(points)):
+            print(f"{xp:<8} {s_val:.12f} {l_val:.12f} {np.sin(xp):.12f}")
@@ -0,0 +1,50 @@
+"""
+Convergence Bookkeeping for Iterative Solvers
+
+The iterative solvers stop on the relative residual ||b - Ax|| / ||b|| <= tol
+(or after max_iter sweeps) and return a ConvergenceInfo alongside x, so an
+unconverged answer is never returned silently.
+
+"""
+
+import numpy as np
+
+class ConvergenceInfo:
+    """Outcome of an iterative solve"""
+
+    def __init__(self, converged, iterations, residual_history):
+        self.converged = converged
+        self.iterations = iterations
+        self.residual_history = residual_history
+
+    @property
+    def residual(self):
+        """Final relative residual"""
+        return self.residual_history[-1] if self.residual_history else np.nan
+
+    def __repr__(self):
+        return (f"ConvergenceInfo(converged={self.converged}, iterations={self.iterations}, "
+                f"residual={self.residual:.2e})")
+
+def rhs_norm(b):
+    """Norm used to make residuals relative (1 for a zero right-hand side)"""
+    norm = np.linalg.norm(b)
+    return norm if norm > 0 else 1.0
+
+class BatchConvergenceInfo:
+    """Per-system outcome of a batched iterative solve"""
+
+    def __init__(self, converged, iterations, residual):
+        self.converged = converged
+        self.iterations = iterations
+        self.residual = residual
+
+    def __repr__(self):
+        return (f"BatchConvergenceInfo(batch={len(self.converged)}, "
+                f"converged={int(self.converged.sum())}, max_iterations={self.iterations.max()}, "
+                f"max_residual={self.residual.max():.2e})")
+
+def batch_rhs_norms(b):
+    """Row-wise norms of a (batch, n) right-hand side (1 where a row is zero)"""
+    norms = np.linalg.norm(b, axis=1)
+    return np.where(norms > 0, norms, 1.0)
@@ -0,0 +1,205 @@
+"""
+Krylov Subspace Methods
+
+Solves Ax = b with
+    - conjugate gradient (CG) and preconditioned CG for SPD matrices
+    - restarted GMRES(m) for general nonsingular matrices
+
+A may be a dense array, a SciPy sparse matrix, a CSR triple or a callable
+returning Ax. The preconditioner M may be a callable r -> z ≈ A⁻¹r or one of
+"jacobi", "ssor", "ic" (see preconditioners.py, these need A as a matrix).
+Like jacobi and gauss_seidel, both solvers stop on ||b - Ax|| / ||b|| <= tol
+and return (x, ConvergenceInfo).
+
+Problem:
+    2D Poisson equation on a 30 x 30 grid (5-point stencil), b = 1
+
+"""
+
+import numpy as np
+
+from convergence import ConvergenceInfo, rhs_norm
+from preconditioners import (
+    incomplete_cholesky_preconditioner,
+    jacobi_preconditioner,
+    ssor_preconditioner,
+)
+from sparse_matrix import to_csr
+
+PRECONDITIONERS = {
+    "jacobi": jacobi_preconditioner,
+    "ssor": ssor_preconditioner,
+    "ic": incomplete_cholesky_preconditioner,
+}
+
+def _as_operator(A):
+    """Returns a mat-vec callable for a matrix or an existing callable"""
+    return A if callable(A) else to_csr(A).matvec
+
+def _as_preconditioner(M, A):
+    """Resolves M (None, callable or preconditioner name) to a callable"""
+    if M is None:
+        return lambda r: r
+    if callable(M):
+        return M
+    if M not in PRECONDITIONERS:
+        raise ValueError(f"Unknown preconditioner '{M}'. Use one of {sorted(PRECONDITIONERS)}.")
+    if callable(A):
+        raise ValueError("Named preconditioners need A as a matrix, not a callable.")
+    return PRECONDITIONERS[M](A)
+
+def cg(A, b, x0=None, tol=1e-8, max_iter=1000, M=None, callback=None):
+    """
+    Applies the (preconditioned) conjugate gradient method to solve Ax = b.
+
+    Parameters:
+        A: SPD matrix (dense, SciPy sparse or CSR triple) or callable v -> Av
+        b (ndarray): Right-hand side
+        x0 (ndarray): Initial guess (zeros by default)
+        tol (float): Stop when ||b - Ax|| / ||b|| <= tol
+        max_iter (int): Maximum number of iterations
+        M: Symmetric preconditioner (callable or "jacobi", "ssor", "ic")
+        callback (callable): callback(k, x, residual=||b - Ax|| / ||b||) after every iteration
+
+    Returns:
+        tuple: (x, ConvergenceInfo)
+    """
+    matvec = _as_operator(A)
+    precondition = _as_preconditioner(M, A)
+    b = np.asarray(b, dtype=float)
+    b_norm = rhs_norm(b)
+    x = np.zeros(len(b)) if x0 is None else np.array(x0, dtype=float)
+
+    r = b - matvec(x) if x0 is not None else b.copy()
+    z = precondition(r)
+    p = z.copy()
+    rz = r @ z
+
+    history = [np.linalg.norm(r) / b_norm]
+    k = 0
+    while history[-1] > tol and k < max_iter:
+        k += 1
+        Ap = matvec(p)
+        pAp = p @ Ap
+        if pAp <= 0:
+            raise ValueError("Matrix is not positive definite (pᵀAp <= 0 in CG).")
+        alpha = rz / pAp
+        x += alpha * p
+        r -= alpha * Ap
+        history.append(np.linalg.norm(r) / b_norm)
+        if callback is not None:
+            callback(k, x, residual=history[-1])
+
+        z = precondition(r)
+        rz_new = r @ z
+        p = z + (rz_new / rz) * p
+        rz = rz_new
+
+    return x, ConvergenceInfo(history[-1] <= tol, k, history)
+
+def gmres(A, b, x0=None, tol=1e-8, max_iter=1000, restart=30, M=None, callback=None):
+    """
+    Applies restarted GMRES(m) with right preconditioning to solve Ax = b.
+
+    Parameters:
+        A: Matrix (dense, SciPy sparse or CSR triple) or callable v -> Av
+        b (ndarray): Right-hand side
+        x0 (ndarray): Initial guess (zeros by default)
+        tol (float): Stop when ||b - Ax|| / ||b|| <= tol
+        max_iter (int): Maximum total number of inner iterations
+        restart (int): Krylov subspace dimension m between restarts
+        M: Preconditioner (callable or "jacobi", "ssor", "ic")
+        callback (callable): callback(k, None, residual=||b - Ax|| / ||b||) after every inner
+            iteration (the iterate itself is only formed at restarts)
+
+    Returns:
+        tuple: (x, ConvergenceInfo)
+    """
+    matvec = _as_operator(A)
+    precondition = _as_preconditioner(M, A)
+    b = np.asarray(b, dtype=float)
+    b_norm = rhs_norm(b)
+    n = len(b)
+    x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
+    m = min(restart, n)
+
+    history = []
+    k = 0
+    while True:
+        r = b - matvec(x)
+        beta = np.linalg.norm(r)
+        history.append(beta / b_norm)
+        if history[-1] <= tol or k >= max_iter:
+            break
+
+        V = np.zeros((m + 1, n))
+        H = np.zeros((m + 1, m))
+        cs, sn = np.zeros(m), np.zeros(m)
+        g = np.zeros(m + 1)
+        V[0] = r / beta
+        g[0] = beta
+
+        for j in range(m):
+            k += 1
+            w = matvec(precondition(V[j]))
+            # Arnoldi step: classical Gram-Schmidt applied twice (vectorized and stable)
+            h = V[:j + 1] @ w
+            w -= V[:j + 1].T @ h
+            h2 = V[:j + 1] @ w
+            w -= V[:j + 1].T @ h2
+            H[:j + 1, j] = h + h2
+            H[j + 1, j] = np.linalg.norm(w)
+            breakdown = H[j + 1, j] == 0             # exact solution lies in the subspace
+            if not breakdown:
+                V[j + 1] = w / H[j + 1, j]
+
+            # Apply the previous Givens rotations, then eliminate H[j+1, j]
+            for i in range(j):
+                H[i, j], H[i + 1, j] = (cs[i] * H[i, j] + sn[i] * H[i + 1, j],
+                                        -sn[i] * H[i, j] + cs[i] * H[i + 1, j])
+            denom = np.hypot(H[j, j], H[j + 1, j])
+            cs[j], sn[j] = H[j, j] / denom, H[j + 1, j] / denom
+            H[j, j], H[j + 1, j] = denom, 0.0
+            g[j], g[j + 1] = cs[j] * g[j], -sn[j] * g[j]
+
+            # |g[j+1]| is the residual norm of the current iterate, at no extra cost
+            if callback is not None:
+                callback(k, None, residual=abs(g[j + 1]) / b_norm)
+            if abs(g[j + 1]) / b_norm <= tol or k >= max_iter or breakdown:
+                break
+
+        # Back substitution on the (j+1)×(j+1) upper triangle of H
+        y = np.zeros(j + 1)
+        for i in range(j, -1, -1):
+            y[i] = (g[i] - H[i, i + 1:j + 1] @ y[i + 1:]) / H[i, i]
+        x += precondition(V[:j + 1].T @ y)
+
+    return x, ConvergenceInfo(history[-1] <= tol, k, history)
+
+if __name__ == "__main__":
+    from gauss_seidel_iteration import gauss_seidel
+    from jacobi_iteration import jacobi
+
+    # 2D Poisson matrix (5-point stencil): A = I ⊗ T + S ⊗ I
+    m = 30
+    n = m * m
+    S = -(np.eye(m, k=1) + np.eye(m, k=-1))
+    T = 4 * np.eye(m) + S
+    A = np.kron(np.eye(m), T) + np.kron(S, np.eye(m))
+    b = np.ones(n)
+
+    print(f"2D Poisson problem, n = {n}, tol = 1e-8\n")
+    solvers = [
+        ("Jacobi", lambda: jacobi(A, b, max_iter=10000)),
+        ("Gauss-Seidel", lambda: gauss_seidel(A, b, max_iter=10000)),
+        ("SOR (auto omega)", lambda: gauss_seidel(A, b, max_iter=10000, omega="auto")),
+        ("CG", lambda: cg(A, b)),
+        ("PCG (Jacobi)", lambda: cg(A, b, M="jacobi")),
+        ("PCG (SSOR)", lambda: cg(A, b, M="ssor")),
+        ("PCG (IC(0))", lambda: cg(A, b, M="ic")),
+        ("GMRES(30)", lambda: gmres(A, b)),
+        ("GMRES(30) + IC(0)", lambda: gmres(A, b, M="ic")),
+    ]
+    for name, solve in solvers:
+        x, info = solve()
+        print(f"{name:<20} iterations = {info.iterations:5d}, residual = {info.residual:.2e}")
@@ -0,0 +1,117 @@
+"""
+Preconditioners for the Krylov Solvers
+
+Each builder takes A (dense array, SciPy sparse matrix or CSR triple) and
+returns a callable r -> z ≈ A⁻¹r:
+
+    jacobi_preconditioner              z = D⁻¹r
+    ssor_preconditioner                one symmetric SOR sweep on Az = r from z = 0
+                                       (omega = 1 gives symmetric Gauss-Seidel)
+    incomplete_cholesky_preconditioner IC(0): L Lᵀ ≈ A on the sparsity pattern of A
+
+The Jacobi and SSOR variants reuse the sweeps from jacobi_iteration and
+gauss_seidel_iteration; all three are symmetric, so they can be used with CG.
+
+"""
+
+import numpy as np
+
+from gauss_seidel_iteration import _sor_sweep
+from multicolor import color_blocks, multicolor_sweep
+from sparse_matrix import to_csr
+
+def jacobi_preconditioner(A):
+    """Diagonal (Jacobi) preconditioner"""
+    diag = to_csr(A).diagonal()
+    if np.any(diag == 0):
+        raise ValueError("Jacobi preconditioner requires a nonzero diagonal.")
+    inv_diag = 1.0 / diag
+    return lambda r: inv_diag * r
+
+def ssor_preconditioner(A, omega=1.0, ordering="natural"):
+    """SSOR preconditioner: one forward and one backward SOR sweep starting from zero"""
+    A = to_csr(A)
+    diag = A.diagonal()
+    if np.any(diag == 0):
+        raise ValueError("SSOR preconditioner requires a nonzero diagonal.")
+
+    if ordering == "multicolor":
+        forward = color_blocks(A)
+        backward = forward[::-1]
+
+        def apply(r):
+            z = np.zeros(len(r))
+            multicolor_sweep(forward, r, z, omega)
+            multicolor_sweep(backward, r, z, omega)
+            return z
+        return apply
+
+    data, indices, indptr = A.data.tolist(), A.indices.tolist(), A.indptr.tolist()
+    diag = diag.tolist()
+    n = len(diag)
+    forward, backward = range(n), range(n - 1, -1, -1)
+
+    def apply(r):
+        r, z = r.tolist(), [0.0] * n
+        _sor_sweep(data, indices, indptr, diag, r, z, omega, forward)
+        _sor_sweep(data, indices, indptr, diag, r, z, omega, backward)
+        return np.array(z)
+    return apply
+
+def incomplete_cholesky(A):
+    """
+    Zero fill-in incomplete Cholesky factorization (IC(0)) of an SPD CSRMatrix.
+
+    Returns:
+        tuple: (cols, vals, diag) where cols[i] / vals[i] hold the strictly
+        lower entries of row i of L and diag[i] = L[i][i]
+    """
+    n = A.shape[0]
+    indices, indptr, data = A.indices.tolist(), A.indptr.tolist(), A.data.tolist()
+    rows = []                                    # rows[i] = {k: L[i][k]} for k < i
+    diag = [0.0] * n
+
+    for i in range(n):
+        entries = sorted((indices[k], data[k]) for k in range(indptr[i], indptr[i + 1])
+                         if indices[k] <= i)
+        row = {}
+        a_ii = 0.0
+        for k, a_ik in entries:
+            if k == i:
+                a_ii += a_ik
+                continue
+            # L[i][k] = (A[i][k] - sum_m L[i][m] L[k][m]) / L[k][k], restricted to the pattern
+            row_k = rows[k]
+            s = a_ik - sum(v * row_k.get(m, 0.0) for m, v in row.items())
+            row[k] = s / diag[k]
+        d = a_ii - sum(v * v for v in row.values())
+        if d <= 0:
+            raise ValueError(f"Incomplete Cholesky breakdown (non-positive pivot at row {i}).")
+        diag[i] = np.sqrt(d)
+        rows.append(row)
+
+    cols = [list(row.keys()) for row in rows]
+    vals = [list(row.values()) for row in rows]
+    return cols, vals, diag
+
+def incomplete_cholesky_preconditioner(A):
+    """IC(0) preconditioner: z = (L Lᵀ)⁻¹ r by two sparse triangular solves"""
+    cols, vals, diag = incomplete_cholesky(to_csr(A))
+    n = len(diag)
+
+    def apply(r):
+        y = r.tolist()
+        # Forward substitution Ly = r
+        for i in range(n):
+            s = y[i]
+            for k, v in zip(cols[i], vals[i]):
+                s -= v * y[k]
+            y[i] = s / diag[i]
+        # Backward substitution Lᵀz = y (column oriented over the rows of L)
+        for i in range(n - 1, -1, -1):
+            y[i] /= diag[i]
+            z_i = y[i]
+            for k, v in zip(cols[i], vals[i]):
+                y[k] -= v * z_i
+        return np.array(y)
+    return apply
@@ -23,46 +23,123 @@ def LU_decomposition(A):
     U = np.zeros_like(A, dtype=float)
 
     for i in range(n):
-        for j in range(i, n):
-            U[i, j] = A[i, j] - sum(L[i, k] * U[k, j] for k in range(i))
-        for j in range(i + 1, n):
-            L[j, i] = (A[j, i] - sum(L[j, k] * U[k, i] for k in range(i))) / U[i, i]
-    
+        U[i, i:] = A[i, i:] - L[i, :i] @ U[:i, i:]
+        L[i + 1:, i] = (A[i + 1:, i] - L[i + 1:, :i] @ U[:i, i]) / U[i, i]
+
     return L, U
 
-def forward_substitution(L, b):
-    """Solves Ly = b for y using forward substitution"""
+def forward_substitution(L, b, unit_diagonal=True):
+    """Solves Ly = b for y using forward substitution (b may be (n,) or (n, k))"""
     n = L.shape[0]
-    y = np.zeros(n)
+    y = np.array(b, dtype=float)
     for i in range(n):
-        y[i] = b[i] - sum(L[i, j] * y[j] for j in range(i))
+        y[i] -= L[i, :i] @ y[:i]
+        if not unit_diagonal:
+            y[i] /= L[i, i]
     return y
 
-def backward_substitution(U, y):
-    """Solves Ux = y for x using backward substitution"""
+def backward_substitution(U, y, unit_diagonal=False):
+    """Solves Ux = y for x using backward substitution (y may be (n,) or (n, k))"""
     n = U.shape[0]
-    x = np.zeros(n)
+    x = np.array(y, dtype=float)
     for i in range(n - 1, -1, -1):
-        x[i] = (y[i] - sum(U[i, j] * x[j] for j in range(i + 1, n))) / U[i, i]
+        x[i] -= U[i, i + 1:] @ x[i + 1:]
+        if not unit_diagonal:
+            x[i] /= U[i, i]
     return x
 
-# Input matrix A and vector b
-A = np.array([
-    [2, 1, -4, 1],
-    [-4, 3, 5, -2],
-    [1, -1, 1, -1],
-    [1, 3, -3, 2]
-], dtype=float)
+class LUFactorization:
+    """
+    LU factorization PA = LU with partial pivoting, stored packed in one array.
+
+    Parameters:
+        A (ndarray): Square matrix to factor
+        method (str): "doolittle" (unit diagonal L) or "crout" (unit diagonal U)
+        overwrite_a (bool): If True and A is a float array, factor A in place
+
+    The strictly lower part of `lu` holds L and the upper part holds U; the
+    unit diagonal of L (Doolittle) or U (Crout) is implicit.
+    """
+
+    def __init__(self, A, method="doolittle", overwrite_a=False):
+        if method not in ("doolittle", "crout"):
+            raise ValueError(f"Unknown method '{method}'. Use 'doolittle' or 'crout'.")
+        lu = np.asarray(A, dtype=float) if overwrite_a else np.array(A, dtype=float)
+        n = lu.shape[0]
+        if lu.ndim != 2 or lu.shape[1] != n:
+            raise ValueError("Matrix A must be square.")
+
+        perm = np.arange(n)
+        sign = 1.0
+        for i in range(n):
+            # Partial pivoting
+            max_row = np.argmax(np.abs(lu[i:, i])) + i
+            if lu[max_row, i] == 0:
+                raise ValueError(f"Matrix is singular (zero pivot in column {i}).")
+            if max_row != i:
+                lu[[i, max_row]] = lu[[max_row, i]]
+                perm[[i, max_row]] = perm[[max_row, i]]
+                sign = -sign
+
+            # Column (Doolittle) or row (Crout) scaling, then rank-1 update
+            if method == "doolittle":
+                lu[i + 1:, i] /= lu[i, i]
+            else:
+                lu[i, i + 1:] /= lu[i, i]
+            lu[i + 1:, i + 1:] -= np.outer(lu[i + 1:, i], lu[i, i + 1:])
+
+        self.lu = lu
+        self.perm = perm
+        self.sign = sign
+        self.method = method
+
+    def solve(self, b):
+        """Solves Ax = b for a single right-hand side b of shape (n,)"""
+        b = np.asarray(b, dtype=float)
+        if b.shape != (self.lu.shape[0],):
+            raise ValueError("Right-hand side must have shape (n,). Use solve_many for several.")
+        return self._solve(b)
+
+    def solve_many(self, B):
+        """Solves AX = B for right-hand sides stored as the columns of B, shape (n, k)"""
+        B = np.asarray(B, dtype=float)
+        if B.ndim != 2 or B.shape[0] != self.lu.shape[0]:
+            raise ValueError("Right-hand sides must have shape (n, k).")
+        return self._solve(B)
+
+    def _solve(self, b):
+        doolittle = self.method == "doolittle"
+        y = forward_substitution(self.lu, b[self.perm], unit_diagonal=doolittle)
+        return backward_substitution(self.lu, y, unit_diagonal=not doolittle)
+
+    def det(self):
+        """Determinant of A"""
+        return self.sign * np.prod(np.diag(self.lu))
+
+    def logdet(self):
+        """Returns (sign, log|det A|), safe against overflow for large matrices"""
+        diag = np.diag(self.lu)
+        sign = self.sign * np.prod(np.sign(diag))
+        return sign, np.sum(np.log(np.abs(diag)))
+
+if __name__ == "__main__":
+    # Input matrix A and vector b
+    A = np.array([
+        [2, 1, -4, 1],
+        [-4, 3, 5, -2],
+        [1, -1, 1, -1],
+        [1, 3, -3, 2]
+    ], dtype=float)
 
-b = np.array([4, -10, 2, -1], dtype=float)
+    b = np.array([4, -10, 2, -1], dtype=float)
 
-# Perform LU Decomposition and solve
-L, U = LU_decomposition(A)
-y = forward_substitution(L, b)
-x = backward_substitution(U, y)
+    # Perform LU Decomposition and solve
+    L, U = LU_decomposition(A)
+    y = forward_substitution(L, b)
+    x = backward_substitution(U, y)
 
-# Output the result
-print("Solution of the given system of equations is:")
-print("x =", np.round(x).astype(int).tolist())
+    # Output the result
+    print("Solution of the given system of equations is:")
+    print("x =", np.round(x).astype(int).tolist())
 
-# Expected Output: [1, -1, -1, -1]
+    # Expected Output: [1, -1, -1, -1]
@@ -0,0 +1,245 @@
+"""
+Banded Cholesky and LDLᵀ Decomposition
+
+Solves a symmetric positive definite band system Ax = b without ever forming
+the dense n×n matrix. For bandwidth p the factorization costs O(n·p²) time
+and O(n·p) memory.
+
+Band layout (LAPACK-style, lower storage):
+    ab[i - j, j] = A[i, j]    for j <= i <= min(n - 1, j + p)
+
+so ab has shape (p + 1, n): row 0 holds the diagonal and row k the k-th
+subdiagonal. Unused entries at the end of each row are ignored.
+
+Tridiagonal matrices (p = 1) skip the vectorized band updates, whose NumPy
+call overhead dominates when each column has a single subdiagonal entry,
+and use O(n) scalar recurrences on Python floats instead.
+
+Problem:
+Solve the tridiagonal system (p = 1):
+
+    [  4  -1   0   0 ]       [ x1 ]       [ 1 ]
+    [ -1   4  -1   0 ]   *   [ x2 ]   =   [ 0 ]
+    [  0  -1   4  -1 ]       [ x3 ]       [ 0 ]
+    [  0   0  -1   4 ]       [ x4 ]       [ 0 ]
+
+"""
+
+import math
+
+import numpy as np
+
+def dense_to_band(A, p):
+    """Packs the lower band of a symmetric matrix A into (p + 1, n) band storage"""
+    n = A.shape[0]
+    ab = np.zeros((p + 1, n))
+    for k in range(min(p, n - 1) + 1):
+        ab[k, :n - k] = np.diagonal(A, -k)
+    return ab
+
+def band_to_dense(ab):
+    """Expands lower band storage back into a dense symmetric matrix"""
+    p, n = ab.shape[0] - 1, ab.shape[1]
+    A = np.diag(ab[0])
+    for k in range(1, min(p, n - 1) + 1):
+        A += np.diag(ab[k, :n - k], -k) + np.diag(ab[k, :n - k], k)
+    return A
+
+def band_matvec(ab, x):
+    """Computes Ax for a symmetric band matrix in lower band storage"""
+    p, n = ab.shape[0] - 1, ab.shape[1]
+    y = ab[0] * x
+    for k in range(1, min(p, n - 1) + 1):
+        y[k:] += ab[k, :n - k] * x[:n - k]
+        y[:n - k] += ab[k, :n - k] * x[k:]
+    return y
+
+def _padded_band(ab):
+    """Copies ab into a workspace with p zero columns appended, zeroing unused entries"""
+    p, n = ab.shape[0] - 1, ab.shape[1]
+    work = np.zeros((p + 1, n + p))
+    work[:, :n] = ab
+    for k in range(1, p + 1):
+        work[k, max(n - k, 0):n] = 0.0
+    return work
+
+def _trailing_update_indices(p):
+    """Band positions touched by the rank-1 update of the next p columns"""
+    k, l = np.triu_indices(p)
+    # Entry (j + 1 + l, j + 1 + k) of A sits at ab[l - k, j + 1 + k]
+    return l - k, k + 1, k, l
+
+def _tridiagonal_cholesky(ab):
+    """band_cholesky for p = 1: c_j = sqrt(a_j - s_{j-1}²), s_j = e_j / c_j"""
+    n = ab.shape[1]
+    diag, sub = ab[0].tolist(), ab[1].tolist()
+    c, s = [0.0] * n, [0.0] * n
+    s_prev = 0.0
+    for j in range(n):
+        d = diag[j] - s_prev * s_prev
+        if d <= 0:
+            raise ValueError("Matrix is not positive definite.")
+        c[j] = math.sqrt(d)
+        s_prev = s[j] = sub[j] / c[j] if j < n - 1 else 0.0
+    return np.array([c, s])
+
+def _tridiagonal_ldl(ab):
+    """band_ldl for p = 1: d_j = a_j - l_{j-1}²·d_{j-1}, l_j = e_j / d_j"""
+    n = ab.shape[1]
+    diag, sub = ab[0].tolist(), ab[1].tolist()
+    d, l = [0.0] * n, [0.0] * n
+    d_prev = l_prev = 0.0
+    for j in range(n):
+        d_prev = d[j] = diag[j] - l_prev * l_prev * d_prev
+        if d_prev == 0:
+            raise ValueError(f"Zero pivot at row {j}. LDLᵀ without pivoting fails.")
+        l_prev = l[j] = sub[j] / d_prev if j < n - 1 else 0.0
+    return np.array([d, l])
+
+def _tridiagonal_solve(lb, b, unit_diagonal):
+    """_band_triangular_solve for p = 1 and a single right-hand side"""
+    n = lb.shape[1]
+    diag, sub = lb[0].tolist(), lb[1].tolist()
+    x = np.asarray(b, dtype=float).tolist()
+
+    # Forward substitution Ly = b
+    if not unit_diagonal:
+        x[0] /= diag[0]
+    for j in range(1, n):
+        x[j] -= sub[j - 1] * x[j - 1]
+        if not unit_diagonal:
+            x[j] /= diag[j]
+
+    if unit_diagonal:
+        x = [xj / dj for xj, dj in zip(x, diag)]
+    elif n:
+        x[-1] /= diag[-1]
+
+    # Backward substitution Lᵀx = y
+    for j in range(n - 2, -1, -1):
+        x[j] -= sub[j] * x[j + 1]
+        if not unit_diagonal:
+            x[j] /= diag[j]
+    return np.array(x)
+
+def band_cholesky(ab):
+    """
+    Cholesky decomposition (A = L * L.T) of an SPD band matrix.
+
+    Parameters:
+        ab (ndarray): Lower band storage of A, shape (p + 1, n)
+
+    Returns:
+        ndarray: Lower band storage of L, shape (p + 1, n)
+    """
+    p, n = ab.shape[0] - 1, ab.shape[1]
+    if p == 1:
+        return _tridiagonal_cholesky(ab)
+    work = _padded_band(np.asarray(ab, dtype=float))
+    rows, cols, ki, li = _trailing_update_indices(p)
+
+    for j in range(n):
+        if work[0, j] <= 0:
+            raise ValueError("Matrix is not positive definite.")
+        work[0, j] = np.sqrt(work[0, j])
+        v = work[1:, j]
+        v /= work[0, j]
+        work[rows, j + cols] -= v[ki] * v[li]
+
+    return work[:, :n]
+
+def band_ldl(ab):
+    """
+    LDLᵀ decomposition of a symmetric band matrix (no square roots).
+
+    Parameters:
+        ab (ndarray): Lower band storage of A, shape (p + 1, n)
+
+    Returns:
+        ndarray: Packed band storage with D on row 0 and the subdiagonals
+        of the unit lower triangular L on rows 1..p
+    """
+    p, n = ab.shape[0] - 1, ab.shape[1]
+    if p == 1:
+        return _tridiagonal_ldl(ab)
+    work = _padded_band(np.asarray(ab, dtype=float))
+    rows, cols, ki, li = _trailing_update_indices(p)
+
+    for j in range(n):
+        d = work[0, j]
+        if d == 0:
+            raise ValueError(f"Zero pivot at row {j}. LDLᵀ without pivoting fails.")
+        v = work[1:, j]
+        work[rows, j + cols] -= v[ki] * v[li] / d
+        v /= d
+
+    return work[:, :n]
+
+def _band_triangular_solve(lb, b, unit_diagonal):
+    """Solves L Lᵀ x = b (or L D Lᵀ x = b) for b of shape (n,) or (n, k)"""
+    p, n = lb.shape[0] - 1, lb.shape[1]
+    b = np.asarray(b, dtype=float)
+    if p == 1 and b.ndim == 1:
+        return _tridiagonal_solve(lb, b, unit_diagonal)
+    x = np.zeros((n + p,) + b.shape[1:])
+    x[:n] = b
+    x2 = x.reshape(n + p, -1)
+    sub = lb[1:, :, None]
+
+    # Forward substitution Ly = b (column oriented)
+    for j in range(n):
+        if not unit_diagonal:
+            x2[j] /= lb[0, j]
+        x2[j + 1:j + p + 1] -= sub[:, j] * x2[j]
+
+    if unit_diagonal:
+        x2[:n] /= lb[0, :, None]
+
+    # Backward substitution Lᵀx = y (row oriented)
+    for j in range(n - 1, -1, -1):
+        x2[j] -= lb[1:, j] @ x2[j + 1:j + p + 1]
+        if not unit_diagonal:
+            x2[j] /= lb[0, j]
+
+    return x[:n]
+
+def band_cho_solve(lb, b):
+    """Solves Ax = b given the band Cholesky factor from band_cholesky"""
+    return _band_triangular_solve(lb, b, unit_diagonal=False)
+
+def band_ldl_solve(ldl, b):
+    """Solves Ax = b given the packed factor from band_ldl"""
+    return _band_triangular_solve(ldl, b, unit_diagonal=True)
+
+if __name__ == "__main__":
+    # Input matrix A (bandwidth 1) and vector b
+    A = np.array([
+        [ 4, -1,  0,  0],
+        [-1,  4, -1,  0],
+        [ 0, -1,  4, -1],
+        [ 0,  0, -1,  4]
+    ], dtype=float)
+
+    b = np.array([1, 0, 0, 0], dtype=float)
+
+    ab = dense_to_band(A, 1)
+    x_chol = band_cho_solve(band_cholesky(ab), b)
+    x_ldl = band_ldl_solve(band_ldl(ab), b)
+
+    print("Band storage of A:")
+    print(ab)
+    print("\nSolution using band Cholesky:")
+    print("x =", np.round(x_chol, 5))
+    print("\nSolution using band LDLᵀ:")
+    print("x =", np.round(x_ldl, 5))
+
+    # Check the tridiagonal recurrences against a dense solve on a larger system
+    rng = np.random.default_rng(0)
+    n = 500
+    ab = np.array([rng.uniform(2.5, 3.5, n), rng.uniform(-1, 1, n)])
+    b = rng.standard_normal(n)
+    x_ref = np.linalg.solve(band_to_dense(ab), b)
+    err_chol = np.max(np.abs(band_cho_solve(band_cholesky(ab), b) - x_ref))
+    err_ldl = np.max(np.abs(band_ldl_solve(band_ldl(ab), b) - x_ref))
+    print(f"\nTridiagonal n = {n}: max |x - x_dense| = {max(err_chol, err_ldl):.1e}")
+    assert max(err_chol, err_ldl) < 1e-10
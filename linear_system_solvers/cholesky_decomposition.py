@@ -65,28 +65,98 @@ def inverse_matrix(A):
     
     return A_inv
 
-# Input matrix A and vector b
-A = np.array([
-    [ 4, -1,  0,  0],
-    [-1,  4, -1,  0],
-    [ 0, -1,  4, -1],
-    [ 0,  0, -1,  4]
-], dtype=float)
-
-b = np.array([1, 0, 0, 0], dtype=float)
-
-# Decomposition and solving
-L = cholesky_decomposition(A)
-y = forward_substitution(L, b)
-x = backward_substitution(L.T, y)
-A_inv = inverse_matrix(A)
-
-# Output
-print("Solution of the given system of equations is:")
-print("x = [", end="")
-for i in range(len(x)):
-    print(f"{x[i]:.5f}", end=" " if i != len(x) - 1 else "")
-print("]")
-
-print("\nInverse of given matrix A is:")
-print(np.round(A_inv, 8))
+def blocked_cholesky(A, block_size=64, overwrite_a=False):
+    """
+    Blocked, right-looking Cholesky decomposition (A = L * L.T).
+
+    Parameters:
+        A (ndarray): Symmetric positive definite matrix (only the lower triangle is read)
+        block_size (int): Number of columns per block
+        overwrite_a (bool): If True and A is a float array, L overwrites A in place
+
+    Returns:
+        ndarray: Lower triangular factor L
+    """
+    A = np.asarray(A, dtype=float) if overwrite_a else np.array(A, dtype=float)
+    n = A.shape[0]
+
+    for j0 in range(0, n, block_size):
+        j1 = min(j0 + block_size, n)
+
+        # Diagonal block, with vectorized inner products
+        for i in range(j0, j1):
+            d = A[i, i] - A[i, j0:i] @ A[i, j0:i]
+            if d <= 0:
+                raise ValueError("Matrix is not positive definite.")
+            A[i, i] = np.sqrt(d)
+            A[i + 1:j1, i] = (A[i + 1:j1, i] - A[i + 1:j1, j0:i] @ A[i, j0:i]) / A[i, i]
+
+        if j1 < n:
+            # Panel below the diagonal block: L21 = A21 * L11⁻ᵀ
+            for c in range(j0, j1):
+                A[j1:, c] = (A[j1:, c] - A[j1:, j0:c] @ A[c, j0:c]) / A[c, c]
+            # Trailing update A22 -= L21 * L21ᵀ as one matrix-matrix product
+            A[j1:, j1:] -= A[j1:, j0:j1] @ A[j1:, j0:j1].T
+
+    A[np.triu_indices(n, 1)] = 0.0
+    return A
+
+def _solve_lower(L, B, block_size=64):
+    """Solves LY = B in place for B of shape (n, k)"""
+    n = L.shape[0]
+    for j0 in range(0, n, block_size):
+        j1 = min(j0 + block_size, n)
+        for r in range(j0, j1):
+            B[r] = (B[r] - L[r, j0:r] @ B[j0:r]) / L[r, r]
+        B[j1:] -= L[j1:, j0:j1] @ B[j0:j1]
+    return B
+
+def _solve_lower_transpose(L, B, block_size=64):
+    """Solves LᵀX = B in place for B of shape (n, k)"""
+    n = L.shape[0]
+    for j1 in range(n, 0, -block_size):
+        j0 = max(j1 - block_size, 0)
+        for r in range(j1 - 1, j0 - 1, -1):
+            B[r] = (B[r] - L[r + 1:j1, r] @ B[r + 1:j1]) / L[r, r]
+        B[:j0] -= L[j0:j1, :j0].T @ B[j0:j1]
+    return B
+
+def cho_solve(L, B, block_size=64):
+    """Solves AX = B given the Cholesky factor L of A, for B of shape (n,) or (n, k)"""
+    B = np.array(B, dtype=float)
+    X = B.reshape(B.shape[0], -1)
+    _solve_lower(L, X, block_size)
+    _solve_lower_transpose(L, X, block_size)
+    return B
+
+def cho_inverse(L, block_size=64):
+    """Computes A⁻¹ = L⁻ᵀ L⁻¹ directly from the Cholesky factor L"""
+    L_inv = _solve_lower(L, np.eye(L.shape[0]), block_size)
+    return L_inv.T @ L_inv
+
+if __name__ == "__main__":
+    # Input matrix A and vector b
+    A = np.array([
+        [ 4, -1,  0,  0],
+        [-1,  4, -1,  0],
+        [ 0, -1,  4, -1],
+        [ 0,  0, -1,  4]
+    ], dtype=float)
+
+    b = np.array([1, 0, 0, 0], dtype=float)
+
+    # Decomposition and solving
+    L = cholesky_decomposition(A)
+    y = forward_substitution(L, b)
+    x = backward_substitution(L.T, y)
+    A_inv = inverse_matrix(A)
+
+    # Output
+    print("Solution of the given system of equations is:")
+    print("x = [", end="")
+    for i in range(len(x)):
+        print(f"{x[i]:.5f}", end=" " if i != len(x) - 1 else "")
+    print("]")
+
+    print("\nInverse of given matrix A is:")
+    print(np.round(A_inv, 8))
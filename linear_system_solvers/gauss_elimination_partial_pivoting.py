@@ -43,20 +43,120 @@ def gauss_elimination_partial_pivoting(A, b):
 
     return x
 
-# Input matrix A and vector b
-A = np.array([
-    [2, 1, 1, 2],
-    [4, 0, 2, 1],
-    [3, 2, 2, 0],
-    [1, 3, 2, 0]
-])
-b = np.array([2, 3, -1, -4])
-
-# Solve the system
-solution = gauss_elimination_partial_pivoting(A, b)
-
-# Output the result
-print("Solution of the given system of equations is:")
-print("x =", np.round(solution).astype(int).tolist())
-
-# Expected output: [1, -1, -1, 1]
+def _forward_unit_lower(LU, B, block_size):
+    """Solves Ly = B in place, L being the unit lower triangle of LU"""
+    n = LU.shape[0]
+    for j0 in range(0, n, block_size):
+        j1 = min(j0 + block_size, n)
+        # Triangular solve inside the diagonal block
+        for r in range(j0 + 1, j1):
+            B[r] -= LU[r, j0:r] @ B[j0:r]
+        # Level-3 update of the remaining rows
+        B[j1:] -= LU[j1:, j0:j1] @ B[j0:j1]
+    return B
+
+def _backward_upper(LU, B, block_size):
+    """Solves Ux = B in place, U being the upper triangle of LU"""
+    n = LU.shape[0]
+    for j1 in range(n, 0, -block_size):
+        j0 = max(j1 - block_size, 0)
+        for r in range(j1 - 1, j0 - 1, -1):
+            B[r] = (B[r] - LU[r, r + 1:j1] @ B[r + 1:j1]) / LU[r, r]
+        B[:j0] -= LU[:j0, j0:j1] @ B[j0:j1]
+    return B
+
+class GaussFactorization:
+    """
+    Reusable PA = LU factorization produced by blocked Gauss elimination.
+
+    L (unit diagonal) and U are packed into a single array `lu`, and `perm`
+    holds the row permutation, so each new right-hand side only costs two
+    O(n²) triangular solves.
+    """
+
+    def __init__(self, lu, perm, block_size=64):
+        self.lu = lu
+        self.perm = perm
+        self.block_size = block_size
+
+    def solve(self, b):
+        """Solves Ax = b for b of shape (n,) or (n, k)"""
+        b = np.asarray(b, dtype=float)
+        if b.shape[0] != self.lu.shape[0]:
+            raise ValueError("Right-hand side has incompatible shape.")
+        B = b[self.perm]
+        B = B.reshape(len(B), -1)
+        _forward_unit_lower(self.lu, B, self.block_size)
+        _backward_upper(self.lu, B, self.block_size)
+        return B.reshape(b.shape)
+
+def blocked_gauss_factor(A, block_size=64, overwrite_a=False):
+    """
+    Factors PA = LU by right-looking blocked Gauss elimination with partial pivoting.
+
+    Parameters:
+        A (ndarray): Square coefficient matrix
+        block_size (int): Number of columns per panel
+        overwrite_a (bool): If True and A is a float array, factor A in place
+
+    Returns:
+        GaussFactorization: Reusable factorization of A
+    """
+    A = np.asarray(A, dtype=float) if overwrite_a else np.array(A, dtype=float)
+    n = A.shape[0]
+    if A.ndim != 2 or A.shape[1] != n:
+        raise ValueError("Matrix A must be square.")
+    perm = np.arange(n)
+
+    for j0 in range(0, n, block_size):
+        j1 = min(j0 + block_size, n)
+
+        # Panel factorization (unblocked, with row swaps over the full width)
+        for i in range(j0, j1):
+            max_row = np.argmax(np.abs(A[i:, i])) + i
+            if A[max_row, i] == 0:
+                raise ValueError(f"Matrix is singular (zero pivot in column {i}).")
+            if i != max_row:
+                A[[i, max_row]] = A[[max_row, i]]
+                perm[[i, max_row]] = perm[[max_row, i]]
+            A[i + 1:, i] /= A[i, i]
+            A[i + 1:, i + 1:j1] -= np.outer(A[i + 1:, i], A[i, i + 1:j1])
+
+        if j1 < n:
+            # Block row of U: U12 = L11⁻¹ A12
+            for r in range(j0 + 1, j1):
+                A[r, j1:] -= A[r, j0:r] @ A[j0:r, j1:]
+            # Trailing update A22 -= L21 U12 as one matrix-matrix product
+            A[j1:, j1:] -= A[j1:, j0:j1] @ A[j0:j1, j1:]
+
+    return GaussFactorization(A, perm, block_size)
+
+def blocked_gauss_elimination(A, B, block_size=64):
+    """
+    Solves AX = B for one or many right-hand sides using blocked Gauss elimination.
+
+    Returns:
+        tuple: (X, factorization), where X has the shape of B and the
+        factorization can be reused for further right-hand sides
+    """
+    factorization = blocked_gauss_factor(A, block_size=block_size)
+    return factorization.solve(B), factorization
+
+if __name__ == "__main__":
+    # Input matrix A and vector b
+    A = np.array([
+        [2, 1, 1, 2],
+        [4, 0, 2, 1],
+        [3, 2, 2, 0],
+        [1, 3, 2, 0]
+    ])
+    b = np.array([2, 3, -1, -4])
+
+    # Solve the system
+    solution = gauss_elimination_partial_pivoting(A, b)
+
+    # Output the result
+    print("Solution of the given system of equations is:")
+    print("x =", np.round(solution).astype(int).tolist())
+
+    # Expected output: [1, -1, -1, 1]
@@ -0,0 +1,301 @@
+"""
+Forward-Mode Automatic Differentiation
+
+Dual numbers a + b·ε (ε² = 0) carry f and f' through ordinary arithmetic;
+HyperDual numbers carry f, f' and f'' (the one-variable hyper-dual number
+a + b·ε₁ + b·ε₂ + c·ε₁ε₂ with both seeds equal, stored as its three
+distinct parts). One evaluation of f on a HyperDual therefore yields all
+three quantities Chebyshev's and Halley's methods need.
+
+Both classes use __slots__, and their parts may be floats or NumPy arrays:
+with array parts the same code differentiates a whole batch of points at
+once (the array-backed variant used by the vectorized solvers).
+
+Functions to be differentiated must use the operators and the elementary
+functions of this module (sin, cos, exp, ...), which fall back to math or
+NumPy for plain floats and arrays.
+
+Goal:
+    f, f' and f'' of f(x) = cos(x) - x * exp(x) from one evaluation
+
+"""
+
+import math
+import numbers
+
+import numpy as np
+
+def _lib(value):
+    """math for Python scalars, NumPy otherwise"""
+    return math if isinstance(value, (int, float)) else np
+
+class Dual:
+    """value + deriv·ε with ε² = 0"""
+
+    __slots__ = ("value", "deriv")
+
+    # Make NumPy arrays and scalars defer to our reflected operators
+    __array_ufunc__ = None
+
+    def __init__(self, value, deriv=0.0):
+        self.value = value
+        self.deriv = deriv
+
+    def _chain(self, f, f1, f2=None):
+        return Dual(f, f1 * self.deriv)
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value + other.value, self.deriv + other.deriv)
+        return Dual(self.value + other, self.deriv)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value - other.value, self.deriv - other.deriv)
+        return Dual(self.value - other, self.deriv)
+
+    def __rsub__(self, other):
+        return Dual(other - self.value, -self.deriv)
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value * other.value, self.deriv * other.value + self.value * other.deriv)
+        return Dual(self.value * other, self.deriv * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            return self * other._reciprocal()
+        return Dual(self.value / other, self.deriv / other)
+
+    def __rtruediv__(self, other):
+        return other * self._reciprocal()
+
+    def _reciprocal(self):
+        r = 1 / self.value
+        return self._chain(r, -r * r, 2 * r * r * r)
+
+    def __neg__(self):
+        return type(self)(*(-part for part in self._parts()))
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        v = self.value
+        return self * (math.copysign(1.0, v) if _lib(v) is math else np.sign(v))
+
+    def __pow__(self, exponent):
+        if isinstance(exponent, Dual):
+            return exp(exponent * log(self))
+        if exponent == 0:
+            return self * 0 + 1
+        if exponent == 1:
+            return self
+        v = self.value
+        return self._chain(v ** exponent, exponent * v ** (exponent - 1),
+                           exponent * (exponent - 1) * v ** (exponent - 2))
+
+    def __rpow__(self, base):
+        return exp(self * math.log(base))
+
+    # Comparisons look at the value only, so branches in f still work
+    def __lt__(self, other):
+        return self.value < getattr(other, "value", other)
+
+    def __le__(self, other):
+        return self.value <= getattr(other, "value", other)
+
+    def __gt__(self, other):
+        return self.value > getattr(other, "value", other)
+
+    def __ge__(self, other):
+        return self.value >= getattr(other, "value", other)
+
+    def _parts(self):
+        return self.value, self.deriv
+
+    def __repr__(self):
+        return f"Dual({self.value!r}, {self.deriv!r})"
+
+class HyperDual(Dual):
+    """value, first and second derivative propagated together"""
+
+    __slots__ = ("second",)
+
+    def __init__(self, value, deriv=0.0, second=0.0):
+        self.value = value
+        self.deriv = deriv
+        self.second = second
+
+    def _chain(self, f, f1, f2):
+        return HyperDual(f, f1 * self.deriv, f2 * self.deriv * self.deriv + f1 * self.second)
+
+    def __add__(self, other):
+        if isinstance(other, HyperDual):
+            return HyperDual(self.value + other.value, self.deriv + other.deriv,
+                             self.second + other.second)
+        return HyperDual(self.value + other, self.deriv, self.second)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, HyperDual):
+            return HyperDual(self.value - other.value, self.deriv - other.deriv,
+                             self.second - other.second)
+        return HyperDual(self.value - other, self.deriv, self.second)
+
+    def __rsub__(self, other):
+        return HyperDual(other - self.value, -self.deriv, -self.second)
+
+    def __mul__(self, other):
+        if isinstance(other, HyperDual):
+            return HyperDual(self.value * other.value,
+                             self.deriv * other.value + self.value * other.deriv,
+                             self.second * other.value + 2 * self.deriv * other.deriv
+                             + self.value * other.second)
+        return HyperDual(self.value * other, self.deriv * other, self.second * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, HyperDual):
+            return self * other._reciprocal()
+        return HyperDual(self.value / other, self.deriv / other, self.second / other)
+
+    def _parts(self):
+        return self.value, self.deriv, self.second
+
+    def __repr__(self):
+        return f"HyperDual({self.value!r}, {self.deriv!r}, {self.second!r})"
+
+def _elementary(rule):
+    """Lifts rule(v, lib) -> (f(v), f'(v), f''(v)) to floats, arrays, Dual and HyperDual"""
+    def func(x):
+        if isinstance(x, Dual):
+            return x._chain(*rule(x.value, _lib(x.value)))
+        return rule(x, _lib(x))[0]
+    return func
+
+def _exp_rule(v, m):
+    e = m.exp(v)
+    return e, e, e
+
+def _log_rule(v, m):
+    r = 1 / v
+    return m.log(v), r, -r * r
+
+def _sqrt_rule(v, m):
+    s = m.sqrt(v)
+    return s, 0.5 / s, -0.25 / (s * v)
+
+def _tan_rule(v, m):
+    t = m.tan(v)
+    sec2 = 1 + t * t
+    return t, sec2, 2 * t * sec2
+
+def _arctan_rule(v, m):
+    r = 1 / (1 + v * v)
+    return (math.atan(v) if m is math else np.arctan(v)), r, -2 * v * r * r
+
+sin = _elementary(lambda v, m: (m.sin(v), m.cos(v), -m.sin(v)))
+cos = _elementary(lambda v, m: (m.cos(v), -m.sin(v), -m.cos(v)))
+tan = _elementary(_tan_rule)
+exp = _elementary(_exp_rule)
+log = _elementary(_log_rule)
+sqrt = _elementary(_sqrt_rule)
+sinh = _elementary(lambda v, m: (m.sinh(v), m.cosh(v), m.sinh(v)))
+cosh = _elementary(lambda v, m: (m.cosh(v), m.sinh(v), m.cosh(v)))
+arctan = _elementary(_arctan_rule)
+
+def _split(result, order, like):
+    """(f, f', f'') of an f evaluation, allowing f to ignore its argument"""
+    if isinstance(result, Dual):
+        return result._parts() if order == 2 else result._parts() + (None,)
+    zero = 0.0 * like
+    return result, zero, zero
+
+def derivatives(f, x, *args):
+    """(f(x), f'(x), f''(x)) from one HyperDual evaluation (x may be an array)"""
+    return _split(f(HyperDual(x, 1.0 + 0.0 * x, 0.0 * x), *args), 2, x)
+
+def value_and_derivative(f, x, *args):
+    """(f(x), f'(x)) from one Dual evaluation (x may be an array)"""
+    value, deriv, _ = _split(f(Dual(x, 1.0 + 0.0 * x), *args), 1, x)
+    return value, deriv
+
+def _cached_matches(cached, value):
+    """Whether value equals the cached copy: arrays and numbers by value, anything else by identity"""
+    if isinstance(value, np.ndarray):
+        return isinstance(cached, np.ndarray) and cached.shape == value.shape and np.array_equal(cached, value)
+    if isinstance(value, numbers.Number):
+        return isinstance(cached, numbers.Number) and cached == value
+    return cached is value
+
+class AutoDerivatives:
+    """
+    f, f' and f'' as three callables backed by one shared evaluation.
+
+    Solvers call f(x), f_prime(x), f_double_prime(x) at the same point; the
+    first call evaluates f once on a Dual (order 1) or HyperDual (order 2)
+    number and the others reuse it. Extra positional arguments (parameters
+    of the vectorized solvers) are passed through to f.
+    """
+
+    def __init__(self, f, order=2):
+        if order not in (1, 2):
+            raise ValueError("order must be 1 or 2.")
+        self.f = f
+        self.order = order
+        self.evaluations = 0
+        self._key = None
+        self._parts = None
+
+    def _evaluate(self, x, args):
+        key = self._key
+        if key is not None and len(key) == len(args) + 1 \
+                and all(_cached_matches(k, v) for k, v in zip(key, (x,) + args)):
+            return self._parts
+        self.evaluations += 1
+        if self.order == 2:
+            self._parts = derivatives(self.f, x, *args)
+        else:
+            self._parts = value_and_derivative(self.f, x, *args) + (None,)
+        # Arrays are copied so that an in-place update of x is seen as a new point
+        self._key = tuple(v.copy() if isinstance(v, np.ndarray) else v for v in (x,) + args)
+        return self._parts
+
+    def value(self, x, *args):
+        return self._evaluate(x, args)[0]
+
+    def first(self, x, *args):
+        return self._evaluate(x, args)[1]
+
+    def second(self, x, *args):
+        if self.order < 2:
+            raise ValueError("Second derivatives need order=2.")
+        return self._evaluate(x, args)[2]
+
+    def functions(self):
+        """(f, f_prime, f_double_prime) callables for the solvers"""
+        return (self.value, self.first, self.second) if self.order == 2 else (self.value, self.first)
+
+# --- MAIN ---
+if __name__ == "__main__":
+    def f(x):
+        return cos(x) - x * exp(x)
+
+    x = 0.5
+    value, first, second = derivatives(f, x)
+    print("f(x) = cos(x) - x * exp(x) at x = 0.5\n")
+    print(f"{'':<10} {'automatic':>20} {'hand-written':>20}")
+    print(f"{'f':<10} {value:>20.15f} {math.cos(x) - x * math.exp(x):>20.15f}")
+    print(f"{'f_prime':<10} {first:>20.15f} {-math.sin(x) - math.exp(x) * (1 + x):>20.15f}")
+    print(f"{'f_double':<10} {second:>20.15f} {-math.cos(x) - math.exp(x) * (2 + x):>20.15f}")
+
+    xs = np.linspace(0.0, 1.0, 5)
+    values, firsts, seconds = derivatives(f, xs)
+    print(f"\nArray-backed f'' at {xs}: {seconds}")
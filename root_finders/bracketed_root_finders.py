@@ -0,0 +1,190 @@
+"""
+Modified Regula Falsi and Brent's Method
+
+Plain false position keeps one endpoint fixed once the function is convex
+or concave over the bracket, so the bracket never shrinks on that side and
+convergence is only linear. The modified variants scale down the function
+value stored at the retained endpoint whenever the same endpoint is kept
+twice in a row:
+
+    Illinois           f_a <- f_a / 2
+    Pegasus            f_a <- f_a * f_b / (f_b + f_c)
+    Anderson-Björck    f_a <- f_a * (1 - f_c / f_b), or f_a / 2 if that is not positive
+
+Brent's method combines bisection, the secant step and inverse quadratic
+interpolation, falling back to bisection whenever an interpolation step
+would not shrink the bracket fast enough.
+
+All methods keep a sign-changing bracket at every step, so convergence is
+guaranteed for a continuous f, and each iteration costs one evaluation.
+
+Problem:
+    f(x) = ∫₀ˣ e^(-t²) dt - 0.1 on [0, 1]
+
+"""
+
+import math
+
+def check_bracket(f0, f1):
+    """Raises ValueError unless f0 and f1 have opposite signs (or one of them is zero)"""
+    if f0 * f1 > 0:
+        raise ValueError("Root not bracketed. f(x0) and f(x1) must have opposite signs.")
+
+def _illinois(fa, fb, fc):
+    return 0.5
+
+def _pegasus(fa, fb, fc):
+    return fb / (fb + fc)
+
+def _anderson_bjorck(fa, fb, fc):
+    m = 1 - fc / fb
+    return m if m > 0 else 0.5
+
+# Scale factor applied to the retained endpoint's value when it is kept again
+VARIANTS = {
+    "illinois": _illinois,
+    "pegasus": _pegasus,
+    "anderson_bjorck": _anderson_bjorck,
+}
+
+def modified_regula_falsi(f, x0, x1, tol=1e-6, max_iter=50, variant="illinois", verbose=False,
+                          full_output=False, callback=None):
+    """
+    Modified false position (Illinois, Pegasus or Anderson-Björck).
+
+    Parameters:
+        f (callable): Continuous function with f(x0), f(x1) of opposite signs
+        x0, x1 (float): Bracket endpoints
+        tol (float): Stops when |f(x)| < tol
+        max_iter (int): Maximum number of iterations
+        variant (str): Key of VARIANTS
+        verbose (bool): Print intermediate steps
+        full_output (bool): If True, also returns the iteration count
+        callback (callable): callback(i, x, fx, step) after every iteration (see tracing.py)
+
+    Returns:
+        float: Estimated root (or (root, iterations) if full_output)
+    """
+    if variant not in VARIANTS:
+        raise ValueError(f"Unknown variant {variant!r}; choose from {sorted(VARIANTS)}.")
+    scale = VARIANTS[variant]
+
+    # b is always the most recent iterate, a the retained endpoint
+    a, b = x0, x1
+    fa, fb = f(a), f(b)
+    check_bracket(fa, fb)
+    if fa == 0 or fb == 0:
+        root = a if fa == 0 else b
+        return (root, 0) if full_output else root
+
+    for i in range(1, max_iter + 1):
+        c = b - fb * (b - a) / (fb - fa)
+        fc = f(c)
+
+        if verbose:
+            print(f"Iter {i:2d}: x = {c:.10f}, f(x) = {fc:.2e}")
+        if callback is not None:
+            callback(i, c, fc, c - b)
+
+        if abs(fc) < tol or fc == 0:
+            return (c, i) if full_output else c
+
+        if fc * fb < 0:
+            a, fa = b, fb
+        else:
+            fa *= scale(fa, fb, fc)
+        b, fb = c, fc
+
+    raise ValueError(f"Modified regula falsi ({variant}) did not converge in {max_iter} iterations.")
+
+def brent(f, x0, x1, tol=1e-12, max_iter=100, verbose=False, full_output=False, callback=None):
+    """
+    Brent's bracketed hybrid of bisection, secant and inverse quadratic interpolation.
+
+    Parameters:
+        f (callable): Continuous function with f(x0), f(x1) of opposite signs
+        x0, x1 (float): Bracket endpoints
+        tol (float): Stops when the bracket is narrower than about 2·tol
+        max_iter (int): Maximum number of iterations
+        verbose (bool): Print intermediate steps
+        full_output (bool): If True, also returns the iteration count
+        callback (callable): callback(i, x, fx, step) after every iteration (see tracing.py)
+
+    Returns:
+        float: Estimated root (or (root, iterations) if full_output)
+    """
+    a, b = x0, x1
+    fa, fb = f(a), f(b)
+    check_bracket(fa, fb)
+    eps = 2.0 ** -52
+
+    # b: best estimate, a: previous b, c: contrapoint with f(c) of opposite sign
+    c, fc = a, fa
+    d = e = b - a
+    for i in range(1, max_iter + 1):
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol1 = 2 * eps * abs(b) + 0.5 * tol
+        m = 0.5 * (c - b)
+        if abs(m) <= tol1 or fb == 0:
+            return (b, i - 1) if full_output else b
+
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # Secant step
+                p = 2 * m * s
+                q = 1 - s
+            else:
+                # Inverse quadratic interpolation
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            else:
+                p = -p
+            if 2 * p < min(3 * m * q - abs(tol1 * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+
+        a, fa = b, fb
+        step = d if abs(d) > tol1 else math.copysign(tol1, m)
+        b += step
+        fb = f(b)
+
+        if verbose:
+            print(f"Iter {i:2d}: x = {b:.10f}, f(x) = {fb:.2e}")
+        if callback is not None:
+            callback(i, b, fb, step)
+
+    raise ValueError(f"Brent's method did not converge in {max_iter} iterations.")
+
+# --- MAIN ---
+if __name__ == "__main__":
+    from regula_falsi_root_finder import f, regula_falsi
+    from root_solver import CountedFunction
+
+    print("Solving Integral from 0 to x of e^(-t²) dt = 0.1 on [0, 1]\n")
+    print(f"{'method':<18} {'root':>14} {'iterations':>10} {'evaluations':>12}")
+
+    runs = [("regula falsi", lambda g: regula_falsi(0.0, 1.0, tol=1e-10, max_iter=100, verbose=False,
+                                                    f=g, full_output=True))]
+    runs += [(variant, lambda g, v=variant: modified_regula_falsi(g, 0.0, 1.0, tol=1e-10, variant=v,
+                                                                  full_output=True))
+             for variant in VARIANTS]
+    runs += [("brent", lambda g: brent(g, 0.0, 1.0, tol=1e-12, full_output=True))]
+
+    for name, run in runs:
+        counted = CountedFunction(f)
+        root, iterations = run(counted)
+        print(f"{name:<18} {root:>14.10f} {iterations:>10d} {counted.evaluations:>12d}")
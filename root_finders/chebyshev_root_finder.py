@@ -1,18 +1,19 @@
-import math
+import autodiff as ad
 
 def f(x):
-    """Function: f(x) = cos(x) - x * exp(x)"""
-    return math.cos(x) - x * math.exp(x)
+    """Function: f(x) = cos(x) - x * exp(x) (also accepts autodiff numbers)"""
+    return ad.cos(x) - x * ad.exp(x)
 
 def f_prime(x):
     """First derivative: f'(x)"""
-    return -math.sin(x) - math.exp(x) - x * math.exp(x)
+    return -ad.sin(x) - ad.exp(x) - x * ad.exp(x)
 
 def f_double_prime(x):
     """Second derivative: f''(x)"""
-    return -math.cos(x) - 2 * math.exp(x) - x * math.exp(x)
+    return -ad.cos(x) - 2 * ad.exp(x) - x * ad.exp(x)
 
-def chebyshev_method(x0, tol=1e-6, max_iter=20, verbose=True):
+def chebyshev_method(x0, tol=1e-6, max_iter=20, verbose=False, f=f, f_prime=f_prime,
+                     f_double_prime=f_double_prime, full_output=False, callback=None):
     """
     Applies Chebyshev's method to find the root of a function.
     
@@ -21,13 +22,17 @@ def chebyshev_method(x0, tol=1e-6, max_iter=20, verbose=True):
         tol (float): Tolerance for stopping condition
         max_iter (int): Maximum number of iterations
         verbose (bool): If True, prints intermediate results
+        f, f_prime, f_double_prime (callable): Function and its derivatives
+            (default: the module's f(x) = cos(x) - x * exp(x))
+        full_output (bool): If True, also returns the iteration count
+        callback (callable): callback(i, x, fx, step) after every iteration (see tracing.py)
     
     Returns:
-        float: Estimated root
+        float: Estimated root (or (root, iterations) if full_output)
     """
     x = x0
+    fx = f(x)
     for i in range(1, max_iter + 1):
-        fx = f(x)
         fx_p = f_prime(x)
         fx_pp = f_double_prime(x)
 
@@ -39,13 +44,58 @@ def chebyshev_method(x0, tol=1e-6, max_iter=20, verbose=True):
         correction = 0.5 * fx * fx_pp / (fx_p ** 2)
         x_new = x - delta * (1 + correction)
 
+        # f(x_new) is evaluated once, only if printed or needed by the next iteration
+        converged = abs(x_new - x) < tol
+        fx_new = f(x_new) if verbose or not converged else None
         if verbose:
-            print(f"Iter {i:2d}: x = {x_new:.10f}, f(x) = {f(x_new):.2e}")
+            print(f"Iter {i:2d}: x = {x_new:.10f}, f(x) = {fx_new:.2e}")
+        if callback is not None:
+            callback(i, x_new, fx_new, x_new - x)
 
-        if abs(x_new - x) < tol:
-            return x_new
+        if converged:
+            return (x_new, i) if full_output else x_new
         
-        x = x_new
+        x, fx = x_new, fx_new
+
+    raise ValueError(f"Did not converge within {max_iter} iterations.")
+
+def halley_method(x0, tol=1e-6, max_iter=20, verbose=False, f=f, f_prime=None, f_double_prime=None,
+                  full_output=False, callback=None):
+    """
+    Applies Halley's method, x_new = x - 2 f f' / (2 f'^2 - f f'').
+
+    Derivatives left as None are computed by automatic differentiation of f
+    (one HyperDual evaluation per iteration gives f, f' and f'').
+
+    Returns:
+        float: Estimated root (or (root, iterations) if full_output)
+    """
+    if f_prime is None or f_double_prime is None:
+        f, f_prime, f_double_prime = ad.AutoDerivatives(f).functions()
+
+    x = x0
+    fx = f(x)
+    for i in range(1, max_iter + 1):
+        fx_p = f_prime(x)
+        fx_pp = f_double_prime(x)
+
+        denom = 2 * fx_p ** 2 - fx * fx_pp
+        if abs(denom) < 1e-12:
+            raise ValueError(f"Denominator too small at iteration {i}. Method fails.")
+
+        x_new = x - 2 * fx * fx_p / denom
+
+        converged = abs(x_new - x) < tol
+        fx_new = f(x_new) if not converged else None
+        if verbose:
+            print(f"Iter {i:2d}: x = {x_new:.10f}")
+        if callback is not None:
+            callback(i, x_new, fx_new, x_new - x)
+
+        if converged:
+            return (x_new, i) if full_output else x_new
+
+        x, fx = x_new, fx_new
 
     raise ValueError(f"Did not converge within {max_iter} iterations.")
 
@@ -58,7 +108,15 @@ if __name__ == "__main__":
     max_iterations = 10
 
     try:
-        root = chebyshev_method(initial_guess, tol=tolerance, max_iter=max_iterations)
+        root = chebyshev_method(initial_guess, tol=tolerance, max_iter=max_iterations, verbose=True)
         print(f"\nEstimated root: {root:.8f} (accurate to 6 decimal places)")
     except ValueError as e:
         print(f"\nError: {e}")
+
+    # Same method with f' and f'' from automatic differentiation instead of the hand-written ones
+    f_auto, f_prime_auto, f_double_prime_auto = ad.AutoDerivatives(f).functions()
+    root = chebyshev_method(initial_guess, tol=tolerance, max_iter=max_iterations, verbose=False,
+                            f=f_auto, f_prime=f_prime_auto, f_double_prime=f_double_prime_auto)
+    print(f"Estimated root (automatic derivatives): {root:.8f}")
+    root = halley_method(initial_guess, tol=tolerance, max_iter=max_iterations, verbose=False)
+    print(f"Estimated root (Halley, automatic derivatives): {root:.8f}")
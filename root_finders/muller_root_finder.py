@@ -5,7 +5,8 @@ def f(x):
     """Function: f(x) = cos(x) - x * exp(x)"""
     return math.cos(x) - x * math.exp(x)
 
-def muller_method(x0, x1, x2, tol=1e-6, max_iter=20, verbose=True):
+def muller_method(x0, x1, x2, tol=1e-6, max_iter=20, verbose=False, f=f, full_output=False,
+                  complex_iteration=False, max_step=None, callback=None):
     """
     Applies Müller's method to find a root of f(x).
     
@@ -14,12 +15,19 @@ def muller_method(x0, x1, x2, tol=1e-6, max_iter=20, verbose=True):
         tol (float): Tolerance for stopping
         max_iter (int): Maximum iterations allowed
         verbose (bool): Print intermediate steps
+        f (callable): Function to solve (default: the module's f)
+        full_output (bool): If True, also returns the iteration count
+        complex_iteration (bool): Keep the full complex iterate instead of its
+            real part, so complex roots can be reached (f must accept complex x)
+        max_step (float): Longer steps are shortened to this length (keeps the
+            iterates of high-degree polynomials from leaping into overflow)
+        callback (callable): callback(i, x, fx, step) after every iteration (see tracing.py)
     
     Returns:
-        float or complex: Estimated root
+        float or complex: Estimated root (or (root, iterations) if full_output)
     """
+    f0, f1, f2 = f(x0), f(x1), f(x2)
     for i in range(1, max_iter + 1):
-        f0, f1, f2 = f(x0), f(x1), f(x2)
         h0 = x1 - x0
         h1 = x2 - x1
         δ0 = (f1 - f0) / h0
@@ -36,15 +44,25 @@ def muller_method(x0, x1, x2, tol=1e-6, max_iter=20, verbose=True):
             raise ZeroDivisionError("Denominator in Müller method became zero.")
 
         dx = -2 * c / denom
+        if max_step is not None and abs(dx) > max_step:
+            dx *= max_step / abs(dx)
         x3 = x2 + dx
+        x_next = x3 if complex_iteration else x3.real
 
+        # Only the newest point needs a fresh evaluation, and only if printed or iterated on
+        converged = abs(dx) < tol
+        f3 = f(x_next) if verbose or not converged else None
         if verbose:
-            print(f"Iter {i:2d}: x = {x3.real:.10f}, f(x) = {f(x3.real):.2e}")
+            print(f"Iter {i:2d}: x = {x_next:.10f}, f(x) = {f3:.2e}")
+        if callback is not None:
+            callback(i, x_next, f3, dx)
 
-        if abs(dx) < tol:
-            return x3.real if x3.imag == 0 else x3  # Return real part if it's real
+        if converged:
+            root = x3.real if x3.imag == 0 else x3  # Return real part if it's real
+            return (root, i) if full_output else root
         
-        x0, x1, x2 = x1, x2, x3.real
+        x0, x1, x2 = x1, x2, x_next
+        f0, f1, f2 = f1, f2, f3
 
     raise ValueError(f"Did not converge in {max_iter} iterations.")
 
@@ -57,7 +75,7 @@ if __name__ == "__main__":
     max_iterations = 10
 
     try:
-        root_muller = muller_method(x0, x1, x2, tol=tolerance, max_iter=max_iterations)
+        root_muller = muller_method(x0, x1, x2, tol=tolerance, max_iter=max_iterations, verbose=True)
         print(f"\nEstimated root (Müller): {root_muller:.8f} (accurate to 6 decimal places)")
     except Exception as e:
         print(f"\nError: {e}")
@@ -1,63 +1,70 @@
-import math
+from bracketed_root_finders import check_bracket
+from power_series import SERIES
 
 def f(x, terms=10):
-    """Computes f(x) up to given number of terms"""
-    result = 0.1
-    for i in range(1, terms + 1):
-        term = ((-1) ** i) * (x ** i) / (math.factorial(i) ** 2)
-        result += term
-    return result
+    """Computes f(x) up to given number of terms (Horner, cached coefficients)"""
+    return SERIES(x, terms)
 
 def f_prime(x, terms=10):
     """Computes f'(x) up to given number of terms"""
-    result = 0
-    for i in range(1, terms + 1):
-        term = ((-1) ** i) * i * (x ** (i - 1)) / (math.factorial(i) ** 2)
-        result += term
-    return result
-
-def newton_method(x0, tol=1e-5, max_iter=10, verbose=True):
-    """Newton-Raphson method"""
+    return SERIES.derivative(x, terms)
+
+def f_and_prime(x, terms=10):
+    """(f(x), f'(x)) from a single Horner pass"""
+    return SERIES.value_and_derivative(x, terms)
+
+def newton_method(x0, tol=1e-5, max_iter=10, verbose=False, f=f, f_prime=f_prime, full_output=False,
+                  callback=None):
+    """Newton-Raphson method (full_output returns the unrounded root and the iteration count)"""
     x = x0
+    fx = f(x)
     for i in range(1, max_iter + 1):
-        fx = f(x)
         fpx = f_prime(x)
 
         if abs(fpx) < 1e-12:
             raise ZeroDivisionError(f"Derivative too small at iteration {i}.")
 
         x_new = x - fx / fpx
+        # One evaluation serves the printout, the stopping test and the next step
+        fx_new = f(x_new)
 
         if verbose:
-            print(f"Newton Iter {i}: x = {x_new:.10f}, f(x) = {f(x_new):.2e}")
+            print(f"Newton Iter {i}: x = {x_new:.10f}, f(x) = {fx_new:.2e}")
+        if callback is not None:
+            callback(i, x_new, fx_new, x_new - x)
 
-        if abs(f(x_new)) < tol:
-            return round(x_new, 5)
-        x = x_new
+        if abs(fx_new) < tol:
+            return (x_new, i) if full_output else round(x_new, 5)
+        x, fx = x_new, fx_new
 
     raise ValueError("Newton method did not converge.")
 
-def regula_falsi_method(x0, x1, tol=1e-5, max_iter=10, verbose=True):
-    """Regula Falsi (False Position) method"""
-    for i in range(1, max_iter + 1):
-        f0, f1 = f(x0), f(x1)
+def regula_falsi_method(x0, x1, tol=1e-5, max_iter=10, verbose=False, f=f, full_output=False,
+                        callback=None):
+    """Regula Falsi (False Position) method (full_output returns the unrounded root and the iteration count)"""
+    f0, f1 = f(x0), f(x1)
+    check_bracket(f0, f1)
+    x_prev = x1     # the first step is measured from the x1 endpoint
 
-        if f0 * f1 > 0:
-            raise ValueError("Root not bracketed. f(x0) and f(x1) must have opposite signs.")
+    for i in range(1, max_iter + 1):
 
         x2 = x1 - f1 * (x1 - x0) / (f1 - f0)
         fx2 = f(x2)
 
         if verbose:
             print(f"Regula Falsi Iter {i}: x = {x2:.10f}, f(x) = {fx2:.2e}")
+        if callback is not None:
+            callback(i, x2, fx2, x2 - x_prev)
+        x_prev = x2
 
         if abs(fx2) < tol:
-            return round(x2, 5)
+            return (x2, i) if full_output else round(x2, 5)
 
+        # The new point replaces one endpoint; its value is carried with it
         if fx2 * f1 < 0:
-            x0 = x2
+            x0, f0 = x2, fx2
         else:
-            x1 = x2
+            x1, f1 = x2, fx2
 
     raise ValueError("Regula Falsi method did not converge.")
 
@@ -71,12 +78,12 @@ if __name__ == "__main__":
 
     print("Newton-Raphson Method:")
     x0_newton = 0.5
-    root_newton = newton_method(x0_newton, tol=tol, max_iter=max_iterations)
+    root_newton = newton_method(x0_newton, tol=tol, max_iter=max_iterations, verbose=True)
     print(f"\nRoot (Newton's method): {root_newton:.5f} (accurate to 5 digits)\n")
 
     print("Regula Falsi Method:")
     x0_rf, x1_rf = 0.0, 1.0
-    root_rf = regula_falsi_method(x0_rf, x1_rf, tol=tol, max_iter=max_iterations)
+    root_rf = regula_falsi_method(x0_rf, x1_rf, tol=tol, max_iter=max_iterations, verbose=True)
     print(f"\nRoot (Regula Falsi method): {root_rf:.5f} (accurate to 5 digits)\n")
 
     print("Comparison:")
@@ -0,0 +1,286 @@
+"""
+All Roots of a Polynomial
+
+Coefficients are given highest degree first, as for np.polyval:
+p(x) = c[0]·xⁿ + c[1]·xⁿ⁻¹ + ... + c[n].
+
+    muller_polynomial_roots   complex Müller iteration, one root at a time, on
+                              the implicitly deflated p(x) / Π(x - r_j) (the
+                              coefficients are never divided, so deflation
+                              errors do not accumulate), each root polished by
+                              Newton's method on the original p
+    aberth_ehrlich            simultaneous iteration: all n estimates are
+                              updated together, one vectorized Horner pass and
+                              one n x n pairwise-difference sum per step
+    durand_kerner             simpler simultaneous (Weierstrass) iteration
+
+horner() runs the synthetic-division recurrence on scalars or whole arrays
+of points and returns p and p' together. Roots at exactly 0 (trailing zero
+coefficients) are split off before any iteration.
+
+Problem:
+    All roots of random degree-50, degree-300 and degree-500 polynomials
+
+"""
+
+import numpy as np
+
+from muller_root_finder import muller_method
+
+def horner(coeffs, x):
+    """(p(x), p'(x)) by synthetic division; x may be a scalar or an ndarray"""
+    p = coeffs[0]
+    dp = 0 * x
+    for a in coeffs[1:]:
+        dp = dp * x + p
+        p = p * x + a
+    return p, dp
+
+def _as_coefficients(coeffs):
+    coeffs = np.trim_zeros(np.asarray(coeffs, dtype=complex), "f")
+    if coeffs.size < 2:
+        raise ValueError("The polynomial must have degree at least 1.")
+    return coeffs
+
+def _zero_roots(coeffs):
+    """(coefficients with trailing zeros stripped, number of roots exactly at 0)"""
+    trimmed = np.trim_zeros(coeffs, "b")
+    return trimmed, coeffs.size - trimmed.size
+
+def newton_polish(coeffs, z, tol=1e-15, max_iter=10):
+    """Newton steps on p from z until the step is below tol·|z| (or stops shrinking)"""
+    coeffs = list(coeffs)
+    step_size = np.inf
+    for _ in range(max_iter):
+        p, dp = horner(coeffs, z)
+        if dp == 0:
+            break
+        step = p / dp
+        if not abs(step) < step_size:    # stopped shrinking (or overflowed to nan)
+            break
+        z, step_size = z - step, abs(step)
+        if step_size <= tol * abs(z):
+            break
+    return z
+
+def _residual_ratio(coeffs, z):
+    p, _ = horner(coeffs.tolist(), z)
+    scale, _ = horner(np.abs(coeffs).tolist(), np.abs(z))
+    return np.abs(p) / np.where(scale > 0, scale, 1.0)
+
+def _relative_residual(coeffs, z):
+    """
+    |p(z)| relative to Σ|c_k|·|z|^(n-k), the size of its rounding error (0 where both vanish).
+
+    Outside the unit circle the same ratio is evaluated on the reversed
+    polynomial at 1/z, so |z|ⁿ cannot overflow.
+    """
+    outside = np.abs(z) > 1
+    w = np.where(outside, 1 / np.where(outside, z, 1), z)
+    return np.where(outside, _residual_ratio(coeffs[::-1], w), _residual_ratio(coeffs, w))
+
+def _newton_ratio(coeff_list, z):
+    """
+    p(z) / p'(z) for an array z, on the reversed polynomial r at 1/z where |z| > 1.
+
+    With p(z) = zⁿ·r(1/z), p/p' = z·r / (n·r - r'/z), and nothing overflows.
+    """
+    outside = np.abs(z) > 1
+    w = np.where(outside, 1 / np.where(outside, z, 1), z)
+    p, dp = horner(coeff_list, w)
+    r, dr = horner(coeff_list[::-1], w)
+    n = len(coeff_list) - 1
+    with np.errstate(all="ignore"):
+        return np.where(outside, z * r / (n * r - w * dr), p / dp)
+
+def _negligible(coeffs, z):
+    """|p(z)| at the rounding level of evaluating p at z (backward-error test)"""
+    return _relative_residual(coeffs, z) <= 4 * coeffs.size * np.finfo(float).eps
+
+def _root_radius(coeffs):
+    """|c[n] / c[0]|^(1/n), the geometric mean of the root moduli"""
+    n = coeffs.size - 1
+    return abs(coeffs[-1] / coeffs[0]) ** (1.0 / n) if coeffs[-1] != 0 else 1.0
+
+def _initial_circle(coeffs):
+    """n starting points on a circle of radius _root_radius, rotated off the axes"""
+    n = coeffs.size - 1
+    return _root_radius(coeffs) * np.exp(1j * (2 * np.pi * np.arange(n) / n + 0.4))
+
+def _muller_root(coeffs, found, starts, tol, max_iter, accept, max_step):
+    """
+    A root of p(x) / Π(x - found) by complex Müller iteration, from the first start that works.
+
+    Each start is tried on p and on its reversal xⁿ·p(1/x), whose roots are
+    the reciprocals: from near the origin the first finds roots inside the
+    unit circle and the second those outside, and neither has to evaluate a
+    high-degree polynomial far outside the unit disk, where |x|ⁿ swamps it.
+    """
+    for start in starts:
+        for reverse in (False, True):
+            coeff_list = (coeffs[::-1] if reverse else coeffs).tolist()
+            poles = 1 / found if reverse else found
+
+            def deflated(x):
+                p, _ = horner(coeff_list, x)
+                return p / np.prod(x - poles)
+
+            try:
+                with np.errstate(all="ignore"):
+                    root = complex(muller_method(*start, tol=tol, max_iter=max_iter, verbose=False,
+                                                 f=deflated, complex_iteration=True, max_step=max_step))
+            except (ValueError, ZeroDivisionError):
+                continue
+            if reverse:
+                if root == 0:
+                    continue
+                root = 1 / root
+            # A tiny Müller step far from any root is a stall, not a root
+            if np.isfinite(root) and _relative_residual(coeffs, root) <= accept:
+                return root
+    return None
+
+def muller_polynomial_roots(coeffs, tol=1e-12, max_iter=100, polish=True, accept=1e-8):
+    """
+    All roots by complex Müller iteration with implicit deflation.
+
+    Each root is searched for on p(x) / Π(x - r_j) over the roots r_j found so
+    far, first just past the last root found, then from near the origin and
+    from points spread over the circle of radius |c[n]/c[0]|^(1/n) (see
+    _muller_root).
+    Deflating implicitly keeps every evaluation on the original coefficients:
+    explicit synthetic division accumulates errors once roots are not
+    removed in order of increasing modulus, and at degree 400 that corrupts
+    the remaining roots. The roots of a high-degree p are about π/n apart
+    near that circle, so Müller steps are limited to 4/n of its radius and
+    restarts use triples 1/n apart. Roots at exactly 0 are split off first.
+
+    Parameters:
+        coeffs (array_like): Polynomial coefficients, highest degree first
+        tol (float): Müller stops when the step is below tol
+        max_iter (int): Maximum Müller iterations per root
+        polish (bool): Refine every root with Newton's method on the original p
+        accept (float): Largest relative residual |p(z)| / Σ|c_k||z|^(n-k) accepted as a root
+
+    Returns:
+        ndarray: The n complex roots, zeros first, then in the order they were found
+    """
+    coeffs, zeros = _zero_roots(_as_coefficients(coeffs))
+    n = coeffs.size - 1
+    roots = np.zeros(zeros + n, dtype=complex)
+    if n == 0:
+        return roots
+    coeff_list = coeffs.tolist()
+    radius = _root_radius(coeffs)
+    max_step = radius * min(0.5, 4 / n)
+    spread = min(0.1, 1 / n)
+    circle = _initial_circle(coeffs)[::max(1, n // 8)]
+    starts = [(0.5 * radius, -0.5 * radius, 0.0)] + [((1 - spread) * z, z, (1 + spread) * z) for z in circle]
+
+    for k in range(n):
+        found = roots[zeros:zeros + k]
+        # Roots of high-degree polynomials lie in chains, so the next one is
+        # usually found quickest just past the last one
+        tries = starts
+        if k > 0:
+            z = found[-1] * np.exp(2j * np.pi / n)
+            tries = [((1 - spread) * z, z, (1 + spread) * z)] + starts
+        root = _muller_root(coeffs, found, tries, tol, max_iter, accept, max_step)
+        if root is None:
+            raise ValueError(f"Müller iteration failed for root {k + 1} of {n} from every start.")
+        if polish:
+            # Outside the unit circle, polish 1/root on the reversed polynomial
+            polished = (newton_polish(coeff_list, root) if abs(root) <= 1
+                        else 1 / newton_polish(coeff_list[::-1], 1 / root))
+            # Keep the Müller root if polishing slid onto a root found earlier
+            if k == 0 or np.min(np.abs(found - polished)) > np.sqrt(tol) * max(1.0, abs(polished)):
+                root = polished
+        roots[zeros + k] = root
+    return roots
+
+def aberth_ehrlich(coeffs, tol=1e-12, max_iter=500):
+    """
+    All roots by Aberth-Ehrlich simultaneous iteration:
+
+        w_i = (p/p')(z_i) / (1 - (p/p')(z_i) · Σ_{j≠i} 1 / (z_i - z_j))
+
+    An estimate stops moving once its correction is below tol·|z_i| or
+    |p(z_i)| is at rounding level. Estimates outside the unit circle are
+    evaluated through the reversed polynomial (see _newton_ratio).
+
+    Returns:
+        ndarray: The n complex roots (zeros first)
+    """
+    coeffs, zeros = _zero_roots(_as_coefficients(coeffs))
+    if coeffs.size < 2:
+        return np.zeros(zeros, dtype=complex)
+    coeff_list = coeffs.tolist()
+    z = _initial_circle(coeffs)
+    active = np.ones(z.size, dtype=bool)
+
+    for _ in range(max_iter):
+        ratio = _newton_ratio(coeff_list, z[active])
+        diff = z[active, None] - z[None, :]
+        diff[np.arange(diff.shape[0]), np.flatnonzero(active)] = np.inf
+        w = ratio / (1 - ratio * np.sum(1 / diff, axis=1))
+        z[active] -= w
+        still = (np.abs(w) > tol * np.abs(z[active])) & ~_negligible(coeffs, z[active] + w)
+        active[np.flatnonzero(active)[~still]] = False
+        if not active.any():
+            return np.concatenate((np.zeros(zeros, dtype=complex), z))
+
+    raise ValueError(f"Aberth-Ehrlich did not converge within {max_iter} iterations.")
+
+def durand_kerner(coeffs, tol=1e-12, max_iter=1000):
+    """
+    All roots by Durand-Kerner (Weierstrass) iteration:
+
+        z_i <- z_i - p(z_i) / (c[0] · Π_{j≠i} (z_i - z_j))
+
+    Returns:
+        ndarray: The n complex roots (zeros first)
+    """
+    coeffs, zeros = _zero_roots(_as_coefficients(coeffs))
+    if coeffs.size < 2:
+        return np.zeros(zeros, dtype=complex)
+    coeff_list = coeffs.tolist()
+    z = _initial_circle(coeffs)
+
+    for _ in range(max_iter):
+        with np.errstate(over="ignore", invalid="ignore"):
+            p, _ = horner(coeff_list, z)
+            diff = z[:, None] - z[None, :]
+            np.fill_diagonal(diff, 1.0)
+            w = p / (coeffs[0] * np.prod(diff, axis=1))
+        if not np.all(np.isfinite(w)):
+            raise ValueError("Durand-Kerner iterates overflowed; use aberth_ehrlich for this polynomial.")
+        if np.all((np.abs(w) <= tol * np.abs(z - w)) | _negligible(coeffs, z)):
+            return np.concatenate((np.zeros(zeros, dtype=complex), z - w))
+        z = z - w
+
+    raise ValueError(f"Durand-Kerner did not converge within {max_iter} iterations.")
+
+def match_error(found, exact):
+    """Largest distance from each exact root to its nearest found root"""
+    return float(np.max(np.min(np.abs(np.asarray(exact)[:, None] - np.asarray(found)[None, :]), axis=1)))
+
+# --- MAIN ---
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(0)
+    print("Random-coefficient polynomials; error = distance to the nearest np.roots root\n")
+    print(f"{'degree':>6} {'method':<16} {'time (s)':>9} {'max root error':>15}")
+    for degree in (50, 300, 500):
+        coeffs = rng.standard_normal(degree + 1)
+        exact = np.roots(coeffs)
+        for name, method in [("Müller", muller_polynomial_roots), ("Aberth-Ehrlich", aberth_ehrlich),
+                             ("Durand-Kerner", durand_kerner)]:
+            start = time.perf_counter()
+            try:
+                found = method(coeffs)
+            except ValueError as e:
+                print(f"{degree:>6} {name:<16} {e}")
+                continue
+            elapsed = time.perf_counter() - start
+            print(f"{degree:>6} {name:<16} {elapsed:>9.3f} {match_error(found, exact):>15.1e}")
@@ -0,0 +1,108 @@
+"""
+Truncated Power Series with Cached Coefficients
+
+A TruncatedPowerSeries is defined by its coefficient rule a(i). The
+coefficient array a_0 ... a_n is computed once per number of terms and
+cached, and the value and derivative are then produced together by one
+Horner pass:
+
+    p <- a_n,  p' <- 0
+    p' <- p' x + p,  p <- p x + a_k      for k = n-1, ..., 0
+
+Scalars and NumPy arrays are both accepted. adaptive() instead sums terms
+until they fall below a tolerance and reports how many were needed.
+
+Problem:
+    f(x) = 0.1 - x + x²/(2!)² - x³/(3!)² + ...
+
+"""
+
+import math
+
+import numpy as np
+
+class TruncatedPowerSeries:
+    """Σ a(i)·xⁱ truncated after `terms` terms beyond the constant"""
+
+    def __init__(self, coefficient):
+        self.coefficient = coefficient
+        self._cache = {}
+
+    def coefficients(self, terms):
+        """a_0 ... a_terms as a float array (cached by terms)"""
+        coeffs = self._cache.get(terms)
+        if coeffs is None:
+            coeffs = self._cache[terms] = np.array([self.coefficient(i) for i in range(terms + 1)],
+                                                    dtype=float)
+        return coeffs
+
+    def value_and_derivative(self, x, terms):
+        """(S(x), S'(x)) of the series truncated after `terms` terms, in one Horner pass"""
+        coeffs = self.coefficients(terms).tolist()
+        # Floats, ndarrays and autodiff numbers go through Horner unchanged
+        if isinstance(x, (list, tuple)):
+            x = np.asarray(x, dtype=float)
+        p = coeffs[terms]
+        dp = 0.0 * x
+        for a in reversed(coeffs[:terms]):
+            dp = dp * x + p
+            p = p * x + a
+        return p, dp
+
+    def __call__(self, x, terms):
+        p, _ = self.value_and_derivative(x, terms)
+        return p
+
+    def derivative(self, x, terms):
+        _, dp = self.value_and_derivative(x, terms)
+        return dp
+
+    def adaptive(self, x, tol=1e-16, max_terms=200):
+        """
+        Sums terms until |a_i xⁱ| <= tol·|S| for every x (and likewise for S').
+
+        Returns:
+            tuple: (S(x), S'(x), number of terms used)
+        """
+        coeffs = self.coefficients(max_terms).tolist()
+        x = np.asarray(x, dtype=float)
+        value = np.full(x.shape, coeffs[0])
+        slope = np.zeros(x.shape)
+        power = np.ones(x.shape)
+        for i in range(1, max_terms + 1):
+            a = coeffs[i]
+            slope_term = i * a * power
+            power = power * x
+            term = a * power
+            value = value + term
+            slope = slope + slope_term
+            if np.all((np.abs(term) <= tol * np.abs(value)) & (np.abs(slope_term) <= tol * np.abs(slope))):
+                break
+        else:
+            raise ValueError(f"Series terms still above tol = {tol:g} after {max_terms} terms.")
+        if value.ndim == 0:
+            return float(value), float(slope), i
+        return value, slope, i
+
+def _alternating_inverse_factorial_squares(i):
+    """a_0 = 0.1, a_i = (-1)^i / (i!)²"""
+    return 0.1 if i == 0 else (-1) ** i / math.factorial(i) ** 2
+
+# Series of newton_vs_regula_falsi_root_finder.f
+SERIES = TruncatedPowerSeries(_alternating_inverse_factorial_squares)
+
+# --- MAIN ---
+if __name__ == "__main__":
+    import time
+
+    print("f(x) = 0.1 - x + x²/(2!)² - x³/(3!)² + ...\n")
+    for terms in (5, 10, 20):
+        value, slope = SERIES.value_and_derivative(0.1, terms)
+        print(f"terms = {terms:2d}: f(0.1) = {value:.16f}, f'(0.1) = {slope:.16f}")
+    value, slope, used = SERIES.adaptive(0.1)
+    print(f"adaptive:   f(0.1) = {value:.16f}, f'(0.1) = {slope:.16f} ({used} terms)")
+
+    xs = np.linspace(0.0, 2.0, 1_000_000)
+    start = time.perf_counter()
+    SERIES.value_and_derivative(xs, 10)
+    print(f"\nValue and derivative at 10⁶ points: {1e3 * (time.perf_counter() - start):.1f} ms")
@@ -1,4 +1,10 @@
 import math
+from functools import lru_cache
+
+import numpy as np
+
+from bracketed_root_finders import check_bracket
+from quadrature import CumulativeIntegral, gauss_kronrod
 
 def f(x, num_intervals=10000):
     """Computes f(x) = ∫₀ˣ e^(-t²) dt - 0.1 using trapezoidal rule"""
@@ -13,27 +19,57 @@ def f(x, num_intervals=10000):
     integral *= h
     return integral - 0.1
 
-def regula_falsi(x0, x1, tol=1e-6, max_iter=20, verbose=True):
-    """Applies the Regula Falsi method to find root of f(x) = ∫₀ˣ e^(-t²) dt - 0.1"""
-    for i in range(1, max_iter + 1):
-        f0, f1 = f(x0), f(x1)
+def integrand(t):
+    """e^(-t²) on an array of nodes"""
+    return np.exp(-np.square(t))
+
+def f_quadrature(x, tol=1e-13):
+    """f(x) with adaptive Gauss-Kronrod quadrature (a few vectorized integrand calls)"""
+    return gauss_kronrod(integrand, 0.0, x, tol=tol) - 0.1
+
+@lru_cache(maxsize=None)
+def integral_table(b=3.0, num_panels=3000):
+    """Cumulative table of ∫₀ˣ e^(-t²) dt on [0, b], built once per (b, num_panels)"""
+    return CumulativeIntegral(integrand, 0.0, b, num_panels)
+
+def f_table(x):
+    """f(x) by O(1) interpolation in the cumulative table (0 <= x <= 3)"""
+    return integral_table()(x) - 0.1
 
-        if f0 * f1 > 0:
-            raise ValueError("Function has same signs at x0 and x1. Root not bracketed.")
+def solve_targets(targets):
+    """Solves ∫₀ˣ e^(-t²) dt = c for every c in targets, all reusing the cumulative table"""
+    return integral_table().solve(targets)
+
+def regula_falsi(x0, x1, tol=1e-6, max_iter=20, verbose=False, f=f, full_output=False, callback=None):
+    """
+    Applies the Regula Falsi method to find root of f(x) = ∫₀ˣ e^(-t²) dt - 0.1
+
+    Any other f can be passed in; full_output returns (unrounded root, iterations);
+    callback(i, x, fx, step) is called after every iteration (see tracing.py).
+    """
+    f0, f1 = f(x0), f(x1)
+    check_bracket(f0, f1)
+    x_prev = x1     # the first step is measured from the x1 endpoint
+
+    for i in range(1, max_iter + 1):
 
         x2 = x1 - f1 * (x1 - x0) / (f1 - f0)
         fx2 = f(x2)
 
         if verbose:
             print(f"Iter {i:2d}: x = {x2:.10f}, f(x) = {fx2:.2e}")
+        if callback is not None:
+            callback(i, x2, fx2, x2 - x_prev)
+        x_prev = x2
 
         if abs(fx2) < tol:
-            return round(x2, 6)
+            return (x2, i) if full_output else round(x2, 6)
 
+        # The new point replaces one endpoint; its value is carried with it
         if fx2 * f1 < 0:
-            x0 = x2
+            x0, f0 = x2, fx2
         else:
-            x1 = x2
+            x1, f1 = x2, fx2
 
     raise ValueError("Regula Falsi did not converge in given iterations.")
 
@@ -46,7 +82,18 @@ if __name__ == "__main__":
     max_iterations = 20
 
     try:
-        root = regula_falsi(x0, x1, tol=tolerance, max_iter=max_iterations)
+        root = regula_falsi(x0, x1, tol=tolerance, max_iter=max_iterations, verbose=True)
         print(f"\nRoot (Regula Falsi method): {root:.6f} (accurate to 6 decimal places)")
     except Exception as e:
         print(f"\nError: {e}")
+
+    print("\nFaster backends for f:")
+    for name, g in [("Gauss-Kronrod", f_quadrature), ("cumulative table", f_table)]:
+        root = regula_falsi(x0, x1, tol=tolerance, max_iter=max_iterations, verbose=False, f=g)
+        print(f"Root ({name}): {root:.6f}")
+
+    targets = [0.1, 0.2, 0.3, 0.4, 0.5]
+    roots = solve_targets(targets).roots
+    print("\nRoots of ∫₀ˣ e^(-t²) dt = c from one table:")
+    for c, root in zip(targets, roots):
+        print(f"c = {c}: x = {root:.10f}")
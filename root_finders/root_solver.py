@@ -0,0 +1,230 @@
+"""
+Shared Root-Solver Interface
+
+solve(method, f, ...) runs any registered root finder on a user-supplied f
+(and derivatives, where the method needs them) and returns a RootResult with
+the root, the iteration count, the number of evaluations of f and of each
+derivative, and the wall time. The solvers carry function values forward
+(each iteration evaluates f once, at the new point), and the evaluation
+counts make that checkable. Methods are looked up by name in METHODS, so
+benchmarks can swap methods per workload without code changes.
+
+    method           needs
+    "newton"         x0, df
+    "chebyshev"      x0, df, d2f
+    "halley"         x0, df, d2f
+    "muller"         x0 = (x0, x1, x2), or a bracket (its midpoint is the third point)
+    "regula_falsi"   bracket = (a, b) with f(a), f(b) of opposite signs
+    "illinois", "pegasus", "anderson_bjorck", "brent"
+                     bracket, as for "regula_falsi"
+
+Derivatives that are not supplied are obtained by automatic differentiation
+(autodiff.py); f must then be written with autodiff's elementary functions.
+
+Problem:
+    Solve cos(x) - x * exp(x) = 0 with every method
+
+"""
+
+import math
+import time
+from collections import OrderedDict
+
+from autodiff import AutoDerivatives
+from bracketed_root_finders import VARIANTS, brent, modified_regula_falsi
+from chebyshev_root_finder import chebyshev_method, halley_method
+from muller_root_finder import muller_method
+from newton_vs_regula_falsi_root_finder import newton_method
+from regula_falsi_root_finder import regula_falsi
+
+class CountedFunction:
+    """
+    Wraps f, counting calls and actual evaluations.
+
+    With cache_size > 0 the most recent cache_size (x, f(x)) pairs are kept,
+    so repeated calls at the same x (e.g. bracket endpoints revisited by an
+    outer loop) cost nothing; `calls` counts every request and `evaluations`
+    only the ones that reached f.
+    """
+
+    def __init__(self, f, cache_size=0):
+        self.f = f
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.calls = 0
+        self.evaluations = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        if self.cache_size:
+            if x in self.cache:
+                self.cache.move_to_end(x)
+                return self.cache[x]
+            value = self.cache[x] = self.f(x)
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        else:
+            value = self.f(x)
+        self.evaluations += 1
+        return value
+
+    def reset(self):
+        self.cache.clear()
+        self.calls = self.evaluations = 0
+
+class RootResult:
+    """Outcome of a solve() call"""
+
+    def __init__(self, root, iterations, evaluations, elapsed, method):
+        self.root = root
+        self.iterations = iterations
+        self.evaluations = evaluations
+        self.elapsed = elapsed
+        self.method = method
+
+    @property
+    def function_evaluations(self):
+        """Evaluations of f alone"""
+        return self.evaluations["f"]
+
+    @property
+    def total_evaluations(self):
+        """Evaluations of f and all derivatives"""
+        return sum(self.evaluations.values())
+
+    @property
+    def time_per_iteration(self):
+        return self.elapsed / self.iterations if self.iterations else math.nan
+
+    def __repr__(self):
+        return (f"RootResult(method={self.method!r}, root={self.root!r}, iterations={self.iterations}, "
+                f"evaluations={self.evaluations}, elapsed={self.elapsed:.2e})")
+
+def _newton(f, df, d2f, x0, bracket, tol, max_iter, **options):
+    return newton_method(x0, tol=tol, max_iter=max_iter, verbose=False, f=f, f_prime=df,
+                         full_output=True, **options)
+
+def _chebyshev(f, df, d2f, x0, bracket, tol, max_iter, **options):
+    return chebyshev_method(x0, tol=tol, max_iter=max_iter, verbose=False, f=f, f_prime=df,
+                            f_double_prime=d2f, full_output=True, **options)
+
+def _halley(f, df, d2f, x0, bracket, tol, max_iter, **options):
+    return halley_method(x0, tol=tol, max_iter=max_iter, verbose=False, f=f, f_prime=df,
+                         f_double_prime=d2f, full_output=True, **options)
+
+def _muller(f, df, d2f, x0, bracket, tol, max_iter, **options):
+    if x0 is None:
+        a, b = bracket
+        x0 = (a, 0.5 * (a + b), b)
+    return muller_method(*x0, tol=tol, max_iter=max_iter, verbose=False, f=f, full_output=True,
+                         **options)
+
+def _regula_falsi(f, df, d2f, x0, bracket, tol, max_iter, **options):
+    return regula_falsi(*bracket, tol=tol, max_iter=max_iter, verbose=False, f=f, full_output=True,
+                        **options)
+
+def _modified_regula_falsi(variant):
+    def run(f, df, d2f, x0, bracket, tol, max_iter, **options):
+        return modified_regula_falsi(f, *bracket, tol=tol, max_iter=max_iter, variant=variant,
+                                     full_output=True, **options)
+    return run
+
+def _brent(f, df, d2f, x0, bracket, tol, max_iter, **options):
+    return brent(f, *bracket, tol=tol, max_iter=max_iter, full_output=True, **options)
+
+# name -> (runner, required arguments); runner(f, df, d2f, x0, bracket, tol, max_iter, **options)
+# returns (root, iterations)
+METHODS = {
+    "newton": (_newton, ("x0", "df")),
+    "chebyshev": (_chebyshev, ("x0", "df", "d2f")),
+    "halley": (_halley, ("x0", "df", "d2f")),
+    "muller": (_muller, ("x0|bracket",)),
+    "regula_falsi": (_regula_falsi, ("bracket",)),
+    **{variant: (_modified_regula_falsi(variant), ("bracket",)) for variant in VARIANTS},
+    "brent": (_brent, ("bracket",)),
+}
+
+def register_method(name, runner, requires=()):
+    """Adds a root finder to METHODS (see the runner signature above)"""
+    METHODS[name] = (runner, tuple(requires))
+
+def solve(method, f, df=None, d2f=None, x0=None, bracket=None, tol=1e-8, max_iter=50, cache_size=0,
+          **options):
+    """
+    Finds a root of f with the named method.
+
+    Parameters:
+        method (str): Key of METHODS
+        f (callable): Function f(x)
+        df, d2f (callable): First and second derivatives (for methods that need them;
+            automatic differentiation of f when omitted)
+        x0 (float or tuple): Initial guess (three guesses for "muller")
+        bracket (tuple): Interval (a, b) for bracketing methods
+        tol (float): Stopping tolerance, as interpreted by the method
+        max_iter (int): Maximum number of iterations
+        cache_size (int): Number of recent (x, f(x)) pairs memoized per function
+        **options: Extra keyword arguments for the underlying method
+
+    Returns:
+        RootResult: Root, iteration count, evaluation counts and wall time
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown method {method!r}; choose from {sorted(METHODS)}.")
+    runner, requires = METHODS[method]
+
+    # Missing derivatives come from one automatic-differentiation pass of f
+    if ("df" in requires and df is None) or ("d2f" in requires and d2f is None):
+        order = 2 if "d2f" in requires else 1
+        auto = AutoDerivatives(f, order)
+        f, df, *rest = auto.functions()
+        d2f = rest[0] if rest else None
+    else:
+        auto = None
+
+    given = {"x0": x0, "bracket": bracket, "df": df, "d2f": d2f}
+    for requirement in requires:
+        if all(given[name] is None for name in requirement.split("|")):
+            raise ValueError(f"Method {method!r} needs {requirement.replace('|', ' or ')}.")
+
+    counted = {name: CountedFunction(g, cache_size) for name, g in [("f", f), ("df", df), ("d2f", d2f)]
+               if g is not None}
+    start = time.perf_counter()
+    root, iterations = runner(counted["f"], counted.get("df"), counted.get("d2f"), x0, bracket,
+                              tol, max_iter, **options)
+    elapsed = time.perf_counter() - start
+
+    evaluations = {name: g.evaluations for name, g in counted.items()}
+    if auto is not None:
+        # f, f' and f'' were calls into one shared (hyper-)dual evaluation of f
+        evaluations = {"f": auto.evaluations}
+    return RootResult(root, iterations, evaluations, elapsed, method)
+
+# --- MAIN ---
+if __name__ == "__main__":
+    def f(x):
+        return math.cos(x) - x * math.exp(x)
+
+    def df(x):
+        return -math.sin(x) - math.exp(x) * (1 + x)
+
+    def d2f(x):
+        return -math.cos(x) - math.exp(x) * (2 + x)
+
+    print("Root of f(x) = cos(x) - x * exp(x) with every method\n")
+    print(f"{'method':<16} {'root':>14} {'iterations':>10} {'evaluations':>12} {'time (µs)':>10}")
+    for name in METHODS:
+        result = solve(name, f, df, d2f, x0=1.0 if name != "muller" else None, bracket=(0.0, 1.0),
+                       tol=1e-10)
+        print(f"{name:<16} {result.root:>14.10f} {result.iterations:>10d} "
+              f"{result.total_evaluations:>12d} {1e6 * result.elapsed:>10.1f}")
+
+    import autodiff as ad
+
+    def f_auto(x):
+        return ad.cos(x) - x * ad.exp(x)
+
+    print("\nWith automatic derivatives (evaluations of f on dual numbers):")
+    for name in ["newton", "chebyshev", "halley"]:
+        result = solve(name, f_auto, x0=1.0, tol=1e-10)
+        print(f"{name:<16} {result.root:>14.10f} {result.iterations:>10d} "
+              f"{result.total_evaluations:>12d} {1e6 * result.elapsed:>10.1f}")
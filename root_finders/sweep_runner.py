@@ -0,0 +1,210 @@
+"""
+Parameter Sweeps over the Root Finders
+
+Runs a case function over every combination of a parameter grid, sharded
+into chunks across a ProcessPoolExecutor so pure-Python solvers use every
+core. Each finished chunk is written as its own columnar .npz file as soon
+as it completes; the files double as the checkpoint, so rerunning the same
+sweep skips every chunk that is already on disk.
+
+    <out_dir>/sweep.json         grid and chunk size (checked on resume)
+    <out_dir>/chunk_00000.npz    columns: index, one per parameter, one per result
+
+A case function is a module-level (picklable) callable taking the grid
+parameters as keyword arguments and returning a dict of scalar results.
+chebyshev_case, muller_case and regula_falsi_case cover the three scripts.
+
+Goal:
+    Sweep (a, x0, tol) for f(x) = cos(x) - a·x·exp(x), then resume after
+    losing part of the output
+
+"""
+
+import itertools
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+import autodiff as ad
+from chebyshev_root_finder import chebyshev_method
+from muller_root_finder import muller_method
+from regula_falsi_root_finder import f as integral_minus_tenth
+from regula_falsi_root_finder import regula_falsi
+from root_solver import CountedFunction
+
+def _failed(calls):
+    return {"root": math.nan, "iterations": -1, "evaluations": calls, "converged": False}
+
+def chebyshev_case(a, x0, tol, max_iter=50):
+    """Chebyshev's method on cos(x) - a·x·exp(x) with automatic derivatives"""
+    auto = ad.AutoDerivatives(lambda x: ad.cos(x) - a * x * ad.exp(x))
+    f, f_prime, f_double_prime = auto.functions()
+    try:
+        root, iterations = chebyshev_method(x0, tol=tol, max_iter=max_iter, verbose=False, f=f,
+                                            f_prime=f_prime, f_double_prime=f_double_prime,
+                                            full_output=True)
+    except (ValueError, ZeroDivisionError, OverflowError):
+        return _failed(auto.evaluations)
+    return {"root": root, "iterations": iterations, "evaluations": auto.evaluations, "converged": True}
+
+def muller_case(a, x0, tol, max_iter=50):
+    """Müller's method on cos(x) - a·x·exp(x) from (x0 - 1, x0, x0 + 1)"""
+    f = CountedFunction(lambda x: math.cos(x) - a * x * math.exp(x))
+    try:
+        root, iterations = muller_method(x0 - 1, x0, x0 + 1, tol=tol, max_iter=max_iter, verbose=False,
+                                         f=f, full_output=True)
+    except (ValueError, ZeroDivisionError, OverflowError):
+        return _failed(f.evaluations)
+    if isinstance(root, complex):
+        return _failed(f.evaluations)
+    return {"root": root, "iterations": iterations, "evaluations": f.evaluations, "converged": True}
+
+def regula_falsi_case(target, tol, x0=0.0, x1=1.0, max_iter=100):
+    """Regula falsi on ∫₀ˣ e^(-t²) dt = target (trapezoid-rule f of the script)"""
+    f = CountedFunction(lambda x: integral_minus_tenth(x) + 0.1 - target)
+    try:
+        root, iterations = regula_falsi(x0, x1, tol=tol, max_iter=max_iter, verbose=False, f=f,
+                                        full_output=True)
+    except (ValueError, ZeroDivisionError, OverflowError):
+        return _failed(f.evaluations)
+    return {"root": root, "iterations": iterations, "evaluations": f.evaluations, "converged": True}
+
+def _jsonable(value):
+    """Python scalar for a NumPy scalar (for JSON and for the math-based solvers)"""
+    return value.item() if isinstance(value, np.generic) else value
+
+def grid_cases(grid):
+    """All combinations of a {name: values} grid as a list of parameter dicts (last name varies fastest)"""
+    names = list(grid)
+    return [dict(zip(names, map(_jsonable, values)))
+            for values in itertools.product(*(grid[name] for name in names))]
+
+def _run_chunk(case, start, cases):
+    """Runs one chunk in a worker; returns its columns"""
+    rows = [case(**params) for params in cases]
+    columns = {"index": np.arange(start, start + len(cases))}
+    for name in cases[0]:
+        columns[name] = np.array([params[name] for params in cases])
+    for name in rows[0]:
+        columns[name] = np.array([row[name] for row in rows])
+    return start, columns
+
+def _chunk_path(out_dir, chunk_id):
+    return os.path.join(out_dir, f"chunk_{chunk_id:05d}.npz")
+
+def _write_chunk(out_dir, chunk_id, columns):
+    """Writes via a temporary file and a rename so a killed sweep never leaves a partial chunk"""
+    path = _chunk_path(out_dir, chunk_id)
+    tmp = path + ".tmp.npz"
+    np.savez(tmp, **columns)
+    os.replace(tmp, path)
+
+def run_sweep(case, grid, out_dir, chunk_size=64, max_workers=None, resume=True):
+    """
+    Runs case(**params) for every combination in grid, chunked across processes.
+
+    Parameters:
+        case (callable): Module-level case function returning a dict of scalars
+        grid (dict): Parameter name -> sequence of values
+        out_dir (str): Directory for the manifest and chunk files
+        chunk_size (int): Cases per task (amortizes inter-process overhead)
+        max_workers (int): Worker processes (None: one per CPU; 0: run in this process)
+        resume (bool): Skip chunks already written by an earlier run of the same sweep;
+            if False, every chunk file already in out_dir is deleted first
+
+    Returns:
+        int: Number of chunks computed by this call
+    """
+    cases = grid_cases(grid)
+    manifest = {"case": f"{case.__module__}.{case.__qualname__}",
+                "grid": {name: list(map(_jsonable, values)) for name, values in grid.items()},
+                "chunk_size": chunk_size}
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, "sweep.json")
+    if resume and os.path.exists(manifest_path):
+        with open(manifest_path) as file:
+            if json.load(file) != manifest:
+                raise ValueError(f"{out_dir} holds a different sweep; use another directory or resume=False.")
+    if not resume:
+        # Chunks of an earlier sweep would otherwise be picked up by load_sweep
+        for name in os.listdir(out_dir):
+            if name.startswith("chunk_") and name.endswith(".npz"):
+                os.remove(os.path.join(out_dir, name))
+    with open(manifest_path, "w") as file:
+        json.dump(manifest, file, indent=2)
+
+    chunk_ids = range(math.ceil(len(cases) / chunk_size))
+    pending = [i for i in chunk_ids if not (resume and os.path.exists(_chunk_path(out_dir, i)))]
+    tasks = [(i * chunk_size, cases[i * chunk_size:(i + 1) * chunk_size]) for i in pending]
+
+    if max_workers == 0:
+        for start, chunk in tasks:
+            _, columns = _run_chunk(case, start, chunk)
+            _write_chunk(out_dir, start // chunk_size, columns)
+        return len(tasks)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(_run_chunk, case, start, chunk) for start, chunk in tasks]
+        for future in as_completed(futures):
+            start, columns = future.result()
+            _write_chunk(out_dir, start // chunk_size, columns)
+    return len(tasks)
+
+def load_sweep(out_dir):
+    """Concatenates every chunk file of a sweep into one dict of columns, ordered by index"""
+    paths = sorted(name for name in os.listdir(out_dir) if name.startswith("chunk_") and name.endswith(".npz")
+                   and ".tmp" not in name)
+    if not paths:
+        raise ValueError(f"No chunk files in {out_dir}.")
+    parts = []
+    for name in paths:
+        with np.load(os.path.join(out_dir, name)) as part:
+            parts.append(dict(part))
+    columns = {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+    order = np.argsort(columns["index"])
+    return {name: values[order] for name, values in columns.items()}
+
+def export_parquet(columns, path):
+    """Writes loaded sweep columns to a Parquet file (needs pyarrow)"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet export needs pyarrow; the .npz chunks are always available.") from e
+    pq.write_table(pa.table(columns), path)
+
+# --- MAIN ---
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    grid = {"a": np.linspace(0.5, 2.0, 40), "x0": [0.0, 0.5, 1.0, 2.0], "tol": [1e-6, 1e-10]}
+    with tempfile.TemporaryDirectory() as out_dir:
+        for name, case in [("Chebyshev", chebyshev_case), ("Müller", muller_case)]:
+            folder = os.path.join(out_dir, name)
+            start = time.perf_counter()
+            computed = run_sweep(case, grid, folder, chunk_size=40)
+            elapsed = time.perf_counter() - start
+            results = load_sweep(folder)
+            print(f"{name}: {len(results['index'])} cases in {computed} chunks, {elapsed:.2f} s, "
+                  f"{int(results['converged'].sum())} converged, "
+                  f"mean evaluations {results['evaluations'].mean():.1f}")
+
+            # Lose two chunks and resume: only those are recomputed
+            os.remove(_chunk_path(folder, 0))
+            os.remove(_chunk_path(folder, 3))
+            computed = run_sweep(case, grid, folder, chunk_size=40)
+            resumed = load_sweep(folder)
+            same = np.array_equal(resumed["root"], results["root"], equal_nan=True)
+            print(f"{name}: resumed, recomputed {computed} chunks, results identical: {same}")
+
+        # A fresh, smaller sweep into the same folder replaces every old chunk
+        small = {"a": [1.0], "x0": [0.5, 1.0], "tol": [1e-10]}
+        computed = run_sweep(chebyshev_case, small, folder, chunk_size=40, resume=False)
+        fresh = load_sweep(folder)
+        assert len(fresh["index"]) == len(grid_cases(small))
+        print(f"Fresh sweep (resume=False): {len(fresh['index'])} cases in {computed} chunk, "
+              f"no chunks left from the previous sweep")
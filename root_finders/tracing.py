@@ -0,0 +1,153 @@
+"""
+Convergence Tracing
+
+Every solver accepts callback=None. When given, it is called once per
+iteration as
+
+    callback(iteration, x, fx=..., step=..., residual=...)
+
+with whatever the solver already has at hand: the solvers never evaluate f
+just for the trace, so fx is None when the new iterate has not been
+evaluated (e.g. on Chebyshev's last iteration). With callback=None the only
+cost is one `is not None` test per iteration.
+
+TraceRecorder is such a callback: it stores iteration, x, f(x), step size,
+residual and elapsed time in a preallocated NumPy buffer (doubling when
+full), exports to CSV or JSON, and estimates the order of convergence.
+The iterative linear solvers in iterative_methods/ call the same interface
+with residual=||b - Ax|| / ||b||.
+
+Goal:
+    Trace Newton, Chebyshev, Halley and regula falsi on cos(x) - x·exp(x)
+    and estimate their convergence orders
+
+"""
+
+import json
+import math
+import time
+
+import numpy as np
+
+FIELDS = ("iteration", "x", "fx", "step", "residual", "time")
+
+def _scalar(value):
+    """float(value), or nan for None and for non-scalar iterates (vectors of linear solvers)"""
+    if value is None:
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+class TraceRecorder:
+    """Per-iteration trace in a preallocated (capacity, len(FIELDS)) buffer"""
+
+    def __init__(self, capacity=64):
+        self._buffer = np.full((capacity, len(FIELDS)), np.nan)
+        self.size = 0
+        self.start = time.perf_counter()
+
+    def __call__(self, iteration, x, fx=None, step=None, residual=None):
+        if self.size == len(self._buffer):
+            grown = np.full((2 * len(self._buffer), len(FIELDS)), np.nan)
+            grown[:self.size] = self._buffer
+            self._buffer = grown
+        if residual is None and fx is not None:
+            residual = abs(fx)
+        row = self._buffer[self.size]
+        row[0] = iteration
+        row[1] = _scalar(x)
+        row[2] = _scalar(fx.real if isinstance(fx, complex) else fx)
+        row[3] = _scalar(None if step is None else abs(step))
+        row[4] = _scalar(residual)
+        row[5] = time.perf_counter() - self.start
+        self.size += 1
+
+    def reset(self):
+        self._buffer[:] = np.nan
+        self.size = 0
+        self.start = time.perf_counter()
+
+    @property
+    def data(self):
+        """(size, len(FIELDS)) view of the recorded rows"""
+        return self._buffer[:self.size]
+
+    def column(self, name):
+        return self.data[:, FIELDS.index(name)]
+
+    def as_dict(self):
+        return {name: self.column(name) for name in FIELDS}
+
+    def to_csv(self, path):
+        np.savetxt(path, self.data, delimiter=",", header=",".join(FIELDS), comments="")
+
+    def to_json(self, path=None):
+        """JSON list of per-iteration records (written to path if given, returned otherwise)"""
+        records = [{name: (None if math.isnan(value) else value) for name, value in zip(FIELDS, row)}
+                   for row in self.data.tolist()]
+        for record in records:
+            record["iteration"] = int(record["iteration"])
+        if path is None:
+            return json.dumps(records)
+        with open(path, "w") as file:
+            json.dump(records, file, indent=1)
+
+    def convergence_orders(self):
+        """
+        Estimates q_k = log(e_{k+1} / e_k) / log(e_k / e_{k-1}) from the step sizes e_k.
+
+        Steps approximate the errors once the iteration is converging; entries
+        that involve missing steps or steps at rounding level are nan.
+        """
+        steps = self.column("step")
+        floor = 64 * np.finfo(float).eps * np.maximum(1.0, np.abs(self.column("x")))
+        steps = np.where(steps > floor, steps, np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            logs = np.log(steps)
+            return (logs[2:] - logs[1:-1]) / (logs[1:-1] - logs[:-2])
+
+    def estimated_order(self):
+        """Median of the finite convergence-order estimates (nan if there are none)"""
+        orders = self.convergence_orders()
+        orders = orders[np.isfinite(orders)]
+        return float(np.median(orders)) if orders.size else math.nan
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return f"TraceRecorder(iterations={self.size}, estimated_order={self.estimated_order():.2f})"
+
+# --- MAIN ---
+if __name__ == "__main__":
+    from bracketed_root_finders import brent, modified_regula_falsi
+    from chebyshev_root_finder import chebyshev_method, f, f_double_prime, f_prime, halley_method
+    from newton_vs_regula_falsi_root_finder import newton_method
+    from regula_falsi_root_finder import regula_falsi
+
+    runs = [
+        ("Newton", lambda t: newton_method(1.0, tol=1e-15, max_iter=20, verbose=False, f=f,
+                                           f_prime=f_prime, callback=t)),
+        ("Chebyshev", lambda t: chebyshev_method(1.0, tol=1e-15, verbose=False, callback=t)),
+        ("Halley", lambda t: halley_method(1.0, tol=1e-15, verbose=False, f_prime=f_prime,
+                                           f_double_prime=f_double_prime, callback=t)),
+        ("regula falsi", lambda t: regula_falsi(0.0, 1.0, tol=1e-15, max_iter=100, verbose=False, f=f,
+                                                callback=t)),
+        ("Illinois", lambda t: modified_regula_falsi(f, 0.0, 1.0, tol=1e-15, callback=t)),
+        ("Brent", lambda t: brent(f, 0.0, 1.0, tol=1e-15, callback=t)),
+    ]
+    print("Convergence traces for f(x) = cos(x) - x * exp(x)\n")
+    print(f"{'method':<14} {'iterations':>10} {'final |f(x)|':>13} {'estimated order':>16}")
+    for name, run in runs:
+        trace = TraceRecorder()
+        run(trace)
+        residuals = trace.column("residual")
+        final = residuals[np.isfinite(residuals)][-1]
+        print(f"{name:<14} {len(trace):>10d} {final:>13.1e} {trace.estimated_order():>16.2f}")
+
+    trace = TraceRecorder()
+    chebyshev_method(1.0, tol=1e-15, verbose=False, callback=trace)
+    print("\nChebyshev trace as JSON:")
+    print(trace.to_json())